@@ -430,6 +430,11 @@ class ConfigManager:
                 f"Weights: {self.matching.weights}"
             )
 
+        # Negative weights would let the weighted score drop below 0
+        negative = {k: v for k, v in self.matching.weights.items() if v < 0}
+        if negative:
+            errors.append(f"Matching weights must be non-negative, got {negative}")
+
         # Validate recommendation thresholds order: auto_clear < manual_review < auto_escalate
         thresholds = self.reporting.recommendation_thresholds
         # Get defaults from ReportingConfig dataclass
@@ -925,7 +925,7 @@ class EnhancedSanctionsDownloader:
                     entity.sanctions_programs.append(prog.text.strip())
 
         # Deduplicate countries
-        entity.countries = list(set(entity.countries))
+        entity.countries = list(dict.fromkeys(entity.countries))
 
         return entity
 
@@ -79,6 +79,13 @@ import hashlib
 from jinja2 import Template
 import xml.etree.ElementTree as ET
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -427,6 +434,9 @@ class ReportValidator:
 class ConstanciaReportGenerator:
     """Enhanced report generator with validation and audit trail"""
 
+    # Compiled HTML template, shared by all instances (see generate_html_report)
+    _html_template: Optional[Template] = None
+
     def __init__(
         self,
         output_dir: Path = Path("reports"),
@@ -527,8 +537,10 @@ class ConstanciaReportGenerator:
         # Log audit entry
         self._log_audit(result, list_metadata)
 
-        template = Template(
-            """
+        # Compiling the template dominates report generation; do it once
+        if ConstanciaReportGenerator._html_template is None:
+            ConstanciaReportGenerator._html_template = Template(
+                """
 <!DOCTYPE html>
 <html lang="es">
 <head>
@@ -823,7 +835,8 @@ class ConstanciaReportGenerator:
 </body>
 </html>
         """
-        )
+            )
+        template = ConstanciaReportGenerator._html_template
 
         html_content = template.render(
             result=result, list_metadata=list_metadata, datetime=datetime
@@ -976,8 +989,11 @@ class ConstanciaReportGenerator:
         filename = f"constancia_{safe_name}_{timestamp}.json"
         filepath = self.output_dir / filename
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(report_data, f, indent=2, ensure_ascii=False)
+        if HAS_ORJSON:
+            filepath.write_bytes(orjson.dumps(report_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, "w", encoding="utf-8") as f:
+                json.dump(report_data, f, indent=2, ensure_ascii=False)
 
         logger.info(f"✓ JSON report generated: {filepath}")
         return str(filepath)
@@ -13,21 +13,27 @@ Features:
 SECURITY: Input validation and secure XML parsing to prevent attacks.
 """
 
+import bisect
 import csv
+import functools
+import heapq
 import json
+import os
 import uuid
 import logging
 import re
 import unicodedata
 from pathlib import Path
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional, Any, Tuple
+from typing import List, Deque, Dict, Optional, Any, Tuple
 from dataclasses import dataclass, field
 
 # PostgreSQL connection for testing
 import psycopg2
 
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 # Try to import lxml for better XML parsing
 try:
@@ -39,8 +45,16 @@ except ImportError:
 
     HAS_LXML = False
 
+# Try to import orjson for faster bulk summary encoding
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from config_manager import get_config, ConfigManager
-from xml_utils import sanitize_for_logging, secure_parse
+from xml_utils import sanitize_for_logging, secure_iterparse
 
 # Setup logging
 logging.basicConfig(
@@ -60,14 +74,115 @@ UNICODE_CYRILLIC_START = "\u0400"
 UNICODE_CYRILLIC_END = "\u04ff"
 
 # Input validation patterns
+# Patterns are anchored by fullmatch(); the ASCII-only ones use re.ASCII
 NAME_PATTERN = re.compile(
-    r"^[A-Za-zÀ-ÿ\s\-\.\'\,\u0600-\u06FF\u0400-\u04FF\u4E00-\u9FFF]{2,200}$"
+    r"[A-Za-zÀ-ÿ\s\-\.\'\,\u0600-\u06FF\u0400-\u04FF\u4E00-\u9FFF]{2,200}"
+)
+# YYYY, YYYY-MM, or YYYY-MM-DD
+DOB_PATTERN = re.compile(r"\d{4}(-\d{2}(-\d{2})?)?", re.ASCII)
+DOC_NUMBER_PATTERN = re.compile(r"[A-Za-z0-9\-\s\.]{1,50}", re.ASCII)
+
+# Year lookup for _extract_year (searched, not anchored): the first
+# four-digit run, which covers YYYY, YYYY-MM-DD, MM/DD/YYYY and DD-MM-YYYY
+_YEAR_RE = re.compile(r"\d{4}")
+
+# Local tag names used by the OFAC enhanced XML parser; qualified with the
+# document namespace once per load instead of once per element lookup
+OFAC_TAG_NAMES = (
+    "entity",
+    "entityType",
+    "names",
+    "name",
+    "translations",
+    "translation",
+    "formattedFullName",
+    "formattedFirstName",
+    "formattedLastName",
+    "identityDocuments",
+    "identityDocument",
+    "type",
+    "documentNumber",
+    "issuingCountry",
+    "issueDate",
+    "expirationDate",
+    "features",
+    "feature",
+    "value",
+    "addresses",
+    "address",
+    "addressLine1",
+    "city",
+    "stateProvince",
+    "postalCode",
+    "country",
+    "sanctionsPrograms",
+    "sanctionsProgram",
 )
-DOB_PATTERN = re.compile(r"^\d{4}(-\d{2}(-\d{2})?)?$")  # YYYY, YYYY-MM, or YYYY-MM-DD
-DOC_NUMBER_PATTERN = re.compile(r"^[A-Za-z0-9\-\s\.]{1,50}$")
+ADDRESS_FIELDS = ("addressLine1", "city", "stateProvince", "postalCode", "country")
+
+# Rows between progress log lines in bulk_screen
+BULK_LOG_INTERVAL = 100
+
+# str.translate tables for the ASCII fast paths of _normalize_name and
+# _normalize_document, derived from the regexes they replace so both paths
+# agree character for character
+_NAME_PUNCT_RE = re.compile(r"[^\w\s]")
+_DOC_SEPARATOR_RE = re.compile(r"[\s\-\.\,\/]")
+_ASCII_NAME_TABLE = str.maketrans(
+    {chr(i): " " for i in range(128) if _NAME_PUNCT_RE.match(chr(i))}
+)
+_ASCII_DOC_TABLE = str.maketrans(
+    {chr(i): None for i in range(128) if _DOC_SEPARATOR_RE.match(chr(i))}
+)
+
+# First direct child with a given (namespace-qualified) tag, or None. The
+# OFAC parser only looks up direct children by exact tag, which lxml's
+# iterchildren does in C without going through the ElementPath matcher.
+if HAS_LXML:
+
+    def _find_child(elem: Any, tag: str) -> Any:
+        return next(elem.iterchildren(tag), None)
+
+else:
 
+    def _find_child(elem: Any, tag: str) -> Any:
+        return elem.find(tag)
 
-@dataclass
+
+@functools.lru_cache(maxsize=256)
+def _ofac_feature_field(feature_type: str) -> Optional[str]:
+    """Entity field filled by an OFAC feature type, or None
+
+    The list uses a few dozen distinct feature types, so the substring
+    tests run once per type instead of once per feature.
+    """
+    ft = feature_type.upper()
+    if "DOB" in ft or ("DATE" in ft and "BIRTH" in ft):
+        return "dateOfBirth"
+    if "POB" in ft or ("PLACE" in ft and "BIRTH" in ft):
+        return "placeOfBirth"
+    if "NATIONAL" in ft:
+        return "nationality"
+    if "CITIZEN" in ft:
+        return "citizenship"
+    if "GENDER" in ft:
+        return "gender"
+    if "TITLE" in ft:
+        return "title"
+    if "IMO" in ft or "VESSEL" in ft:
+        return "vesselIMO"
+    return None
+
+
+def _dob_score_from_years(input_year: int, entity_year: int) -> float:
+    """DOB similarity score for two birth years
+
+    Score = 100 - (years_difference * 20), capped at 0
+    """
+    return max(0, 100 - abs(input_year - entity_year) * 20)
+
+
+@dataclass(slots=True)
 class ConfidenceBreakdown:
     """Detailed confidence score breakdown"""
 
@@ -89,7 +204,7 @@ class ConfidenceBreakdown:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchResult:
     """Complete match result with confidence breakdown and flags"""
 
@@ -103,7 +218,8 @@ class MatchResult:
 
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "entity": self.entity,
+            # Underscore keys are load-time match caches, not entity data
+            "entity": {k: v for k, v in self.entity.items() if not k.startswith("_")},
             "confidence": self.confidence.to_dict(),
             "flags": self.flags,
             "recommendation": self.recommendation,
@@ -113,7 +229,7 @@ class MatchResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ScreeningInput:
     """Input data for screening"""
 
@@ -225,7 +341,7 @@ def validate_screening_input(
                 )
     else:
         # Strict Latin-only mode
-        if not NAME_PATTERN.match(name):
+        if not NAME_PATTERN.fullmatch(name):
             logger.warning(
                 "Invalid name format (Latin-only mode): %s", sanitize_for_logging(name)
             )
@@ -238,7 +354,7 @@ def validate_screening_input(
 
     # Validate DOB if provided
     if input_data.date_of_birth:
-        if not DOB_PATTERN.match(input_data.date_of_birth):
+        if not DOB_PATTERN.fullmatch(input_data.date_of_birth):
             raise InputValidationError(
                 f"DOB must be ISO 8601 format. Got: '{input_data.date_of_birth}'. Example: '1980-01-15'",
                 field="date_of_birth",
@@ -255,7 +371,7 @@ def validate_screening_input(
                 code="DOCUMENT_TOO_LONG",
                 suggestion=f"Shorten to {iv_config.document_max_length} characters or less",
             )
-        if not DOC_NUMBER_PATTERN.match(input_data.document_number):
+        if not DOC_NUMBER_PATTERN.fullmatch(input_data.document_number):
             raise InputValidationError(
                 "Document number contains invalid characters. Allowed: letters, numbers, spaces, hyphens, periods",
                 field="document_number",
@@ -280,13 +396,29 @@ class EnhancedSanctionsScreener:
         self.entities: List[Dict[str, Any]] = []
         # Document index for fast lookup
         self._document_index: Dict[str, List[Dict[str, Any]]] = {}
+        # Flattened candidate names for batched scoring (see _build_name_index)
+        self._candidate_sorted: List[str] = []
+        self._candidate_names: List[str] = []
+        self._candidate_owner: List[int] = []
+        self._candidate_rank: List[int] = []
+        self._candidate_lengths: List[int] = []
+        # Per-entity match fields, indexed like self.entities
+        self._entity_ids: List[str] = []
+        self._entity_birth_years: List[Optional[int]] = []
+        self._entity_countries: List[frozenset] = []
+        self._entity_countries_long: List[Tuple[str, ...]] = []
         # Common names set (normalized)
         self._common_names: set = set()
-        # Screening history for audit trail (with size limit to prevent memory issues)
-        self.screening_history: List[Dict[str, Any]] = []
-        self._max_history_size = (
-            10000  # Limit to prevent memory issues in long-running apps
+        # Screening history for audit trail (bounded deque evicts the oldest
+        # entries in O(1) to prevent memory issues in long-running apps)
+        self._max_history_size = 10000
+        self.screening_history: Deque[Dict[str, Any]] = deque(
+            maxlen=self._max_history_size
         )
+        # Report generator and list metadata, created by the first report;
+        # the metadata is dropped whenever a list is (re)loaded
+        self._report_generator: Optional[Any] = None
+        self._report_metadata: Optional[List[Any]] = None
         # Reports directory for saving reports
         self.reports_dir = Path(self.config.reporting.output_directory)
         self.reports_dir.mkdir(exist_ok=True)
@@ -326,12 +458,6 @@ class EnhancedSanctionsScreener:
         # Audit log subdirectory
         (self.reports_dir / "audit_log").mkdir(exist_ok=True)
 
-        # Screening history for audit trail (with size limit to prevent memory issues)
-        self.screening_history: List[Dict[str, Any]] = []
-        self._max_history_size = (
-            10000  # Limit to prevent memory issues in long-running apps
-        )
-
         logger.info(f"🔧 Enhanced Screener initialized:")
         logger.info(f"   - Data directory: {self.data_dir}")
         logger.info(f"   - Name threshold: {self.config.matching.name_threshold}%")
@@ -356,46 +482,64 @@ class EnhancedSanctionsScreener:
         # Extract namespace dynamically
         ns = self._extract_namespace(xml_file)
         logger.info(f"[DIAG] Namespace extracted: {ns}")
+        tags = {name: f"{ns}{name}" for name in OFAC_TAG_NAMES}
+        self._report_metadata = None
+        entity_tag = tags["entity"]
         count = 0
         try:
-            # Use iterparse to process entities one by one and free memory
-            context = etree.iterparse(str(xml_file), events=("end",))
+            # Stream with secure XML parsing to prevent XXE attacks and free
+            # memory. lxml only reports <entity> end events and lets processed
+            # entities be detached, so the tree never grows with the file.
+            if HAS_LXML:
+                context = secure_iterparse(xml_file, events=("end",), tag=entity_tag)
+            else:
+                context = secure_iterparse(xml_file, events=("end",))
             for event, elem in context:
-                if elem.tag == f"{ns}entity":
-                    entity = self._parse_ofac_entity(elem, ns)
+                if elem.tag == entity_tag:
+                    entity = self._parse_ofac_entity(elem, tags)
                     if entity:
                         self.entities.append(entity)
                         self._index_documents(entity)
                         count += 1
                     elem.clear()  # Free memory
+                    if HAS_LXML:
+                        while elem.getprevious() is not None:
+                            del elem.getparent()[0]
             del context
         except Exception as e:
             logger.error(f"[DIAG] Error during streaming parse: {e}")
+        self._build_name_index()
         logger.info(f"✓ Loaded {count} OFAC entities (streaming parse)")
         return count
 
     def _extract_namespace(self, xml_path: Path) -> str:
         """Extract namespace from XML root"""
         try:
-            with open(xml_path, "rb") as f:
-                for event, elem in etree.iterparse(f, events=("start",)):
-                    tag = elem.tag
-                    if tag.startswith("{"):
-                        ns_end = tag.index("}")
-                        return tag[: ns_end + 1]
-                    break
+            for event, elem in secure_iterparse(xml_path, events=("start",)):
+                tag = elem.tag
+                if tag.startswith("{"):
+                    ns_end = tag.index("}")
+                    return tag[: ns_end + 1]
+                break
         except Exception as e:
             logger.warning(f"Could not extract namespace: {e}")
         return ""
 
-    def _parse_ofac_entity(self, elem: Any, ns: str) -> Optional[Dict[str, Any]]:
-        """Parse OFAC entity element"""
+    def _parse_ofac_entity(
+        self, elem: Any, tags: Dict[str, str]
+    ) -> Optional[Dict[str, Any]]:
+        """Parse OFAC entity element
+
+        Args:
+            elem: OFAC <entity> element
+            tags: Namespace-qualified tag names keyed by local name
+        """
         entity_id = elem.get("id")
         if not entity_id:
             return None
 
         # Entity type
-        entity_type_elem = elem.find(f"{ns}entityType")
+        entity_type_elem = _find_child(elem, tags["entityType"])
         entity_type = (
             entity_type_elem.text if entity_type_elem is not None else "entity"
         )
@@ -405,19 +549,21 @@ class EnhancedSanctionsScreener:
         first_name = None
         last_name = None
 
-        names_section = elem.find(f"{ns}names")
+        names_section = _find_child(elem, tags["names"])
         if names_section is not None:
-            for name_tag in names_section.findall(f"{ns}name"):
-                translations = name_tag.find(f"{ns}translations")
+            for name_tag in names_section.findall(tags["name"]):
+                translations = _find_child(name_tag, tags["translations"])
                 if translations is not None:
-                    for translation in translations.findall(f"{ns}translation"):
-                        formatted_full = translation.find(f"{ns}formattedFullName")
+                    for translation in translations.findall(tags["translation"]):
+                        formatted_full = _find_child(
+                            translation, tags["formattedFullName"]
+                        )
                         if formatted_full is not None and formatted_full.text:
                             all_names.append(formatted_full.text.strip())
 
                         if entity_type.lower() == "individual":
-                            fn = translation.find(f"{ns}formattedFirstName")
-                            ln = translation.find(f"{ns}formattedLastName")
+                            fn = _find_child(translation, tags["formattedFirstName"])
+                            ln = _find_child(translation, tags["formattedLastName"])
                             if fn is not None and fn.text and not first_name:
                                 first_name = fn.text.strip()
                             if ln is not None and ln.text and not last_name:
@@ -443,35 +589,34 @@ class EnhancedSanctionsScreener:
         }
 
         # Parse identity documents (OFAC Enhanced XML: <identityDocuments>/<identityDocument>/<documentNumber>)
-        identity_docs_section = elem.find(f"{ns}identityDocuments")
+        identity_docs_section = _find_child(elem, tags["identityDocuments"])
         if identity_docs_section is not None:
-            for doc in identity_docs_section.findall(f"{ns}identityDocument"):
-                doc_type = self._get_text(doc, f"{ns}type")
-                doc_number = self._get_text(doc, f"{ns}documentNumber")
+            for doc in identity_docs_section.findall(tags["identityDocument"]):
+                doc_type = self._get_text(doc, tags["type"])
+                doc_number = self._get_text(doc, tags["documentNumber"])
                 if doc_number:
                     entity["identity_documents"].append(
                         {
                             "type": doc_type or "Unknown",
                             "number": doc_number,
                             "issuingCountry": self._get_text(
-                                doc, f"{ns}issuingCountry"
+                                doc, tags["issuingCountry"]
                             ),
-                            "issueDate": self._get_text(doc, f"{ns}issueDate"),
+                            "issueDate": self._get_text(doc, tags["issueDate"]),
                             "expirationDate": self._get_text(
-                                doc, f"{ns}expirationDate"
+                                doc, tags["expirationDate"]
                             ),
                         }
                     )
 
         # Parse features
-        features_section = elem.find(f"{ns}features")
+        features_section = _find_child(elem, tags["features"])
         if features_section is not None:
-            for feature in features_section.findall(f"{ns}feature"):
-                feature_type = feature.find(f"{ns}type")
-                value_elem = feature.find(f"{ns}value")
+            for feature in features_section.findall(tags["feature"]):
+                feature_type = _find_child(feature, tags["type"])
+                value_elem = _find_child(feature, tags["value"])
 
                 if feature_type is not None and feature_type.text:
-                    ft = feature_type.text.upper()
                     value = (
                         value_elem.text
                         if value_elem is not None and value_elem.text
@@ -483,61 +628,53 @@ class EnhancedSanctionsScreener:
                     )
 
                     # Extract specific values
-                    if "DOB" in ft or ("DATE" in ft and "BIRTH" in ft):
-                        entity["dateOfBirth"] = value
-                    elif "POB" in ft or ("PLACE" in ft and "BIRTH" in ft):
-                        entity["placeOfBirth"] = value
-                    elif "NATIONAL" in ft:
-                        entity["nationality"] = value
-                        if value:
+                    key = _ofac_feature_field(feature_type.text)
+                    if key is not None:
+                        entity[key] = value
+                        if value and key in ("nationality", "citizenship"):
                             entity["countries"].append(value)
-                    elif "CITIZEN" in ft:
-                        entity["citizenship"] = value
-                        if value:
-                            entity["countries"].append(value)
-                    elif "GENDER" in ft:
-                        entity["gender"] = value
-                    elif "TITLE" in ft:
-                        entity["title"] = value
-                    elif "IMO" in ft or "VESSEL" in ft:
-                        entity["vesselIMO"] = value
 
         # Parse addresses for countries
-        addresses_section = elem.find(f"{ns}addresses")
+        addresses_section = _find_child(elem, tags["addresses"])
         if addresses_section is not None:
             entity["addresses"] = []
-            for addr in addresses_section.findall(f"{ns}address"):
+            field_by_tag = {tags[field]: field for field in ADDRESS_FIELDS}
+            for addr in addresses_section.findall(tags["address"]):
+                # One pass over the children; like _get_text, only the first
+                # element of each field counts
+                texts = {}
+                for child in addr:
+                    field = field_by_tag.get(child.tag)
+                    if field is not None:
+                        texts.setdefault(field, child.text)
                 addr_dict = {}
-                for field in [
-                    "addressLine1",
-                    "city",
-                    "stateProvince",
-                    "postalCode",
-                    "country",
-                ]:
-                    val = self._get_text(addr, f"{ns}{field}")
-                    if val:
-                        addr_dict[field] = val
+                for field in ADDRESS_FIELDS:
+                    val = texts.get(field)
+                    if val and val.strip():
+                        addr_dict[field] = val.strip()
                 if addr_dict:
                     entity["addresses"].append(addr_dict)
                     if addr_dict.get("country"):
                         entity["countries"].append(addr_dict["country"])
 
         # Parse sanctions programs
-        programs = elem.find(f"{ns}sanctionsPrograms")
+        programs = _find_child(elem, tags["sanctionsPrograms"])
         if programs is not None:
             program_list = [
-                p.text for p in programs.findall(f"{ns}sanctionsProgram") if p.text
+                p.text for p in programs.findall(tags["sanctionsProgram"]) if p.text
             ]
             entity["program"] = "; ".join(program_list) if program_list else None
 
-        entity["countries"] = list(set(entity["countries"]))
+        # One-pass dedup that keeps first-seen order, which (unlike set
+        # iteration order) does not change between runs
+        entity["countries"] = list(dict.fromkeys(entity["countries"]))
 
+        self._cache_match_fields(entity)
         return entity
 
     def _get_text(self, elem: Any, path: str) -> Optional[str]:
         """Get text from element"""
-        child = elem.find(path)
+        child = _find_child(elem, path)
         if child is not None and child.text:
             return child.text.strip()
         return None
@@ -553,26 +690,37 @@ class EnhancedSanctionsScreener:
             logger.warning(f"⚠ UN file not found: {xml_file}")
             return 0
 
-        # Use secure XML parsing to prevent XXE attacks
-        tree, root = secure_parse(xml_file)
+        self._report_metadata = None
         count = 0
+        un_entities = []
+
+        # Stream with secure XML parsing to prevent XXE attacks, clearing
+        # each record once parsed. Individuals are added first and entities
+        # after them, as in the file's INDIVIDUALS/ENTITIES sections.
+        for event, elem in secure_iterparse(xml_file, events=("end",)):
+            if elem.tag == "INDIVIDUAL":
+                entity = self._parse_un_individual(elem)
+                if entity:
+                    self.entities.append(entity)
+                    self._index_documents(entity)
+                    count += 1
+            elif elem.tag == "ENTITY":
+                entity = self._parse_un_entity(elem)
+                if entity:
+                    un_entities.append(entity)
+            else:
+                continue
+            elem.clear()
+            if HAS_LXML:
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
 
-        # Parse individuals
-        for individual in root.findall(".//INDIVIDUAL"):
-            entity = self._parse_un_individual(individual)
-            if entity:
-                self.entities.append(entity)
-                self._index_documents(entity)
-                count += 1
-
-        # Parse entities
-        for entity_elem in root.findall(".//ENTITY"):
-            entity = self._parse_un_entity(entity_elem)
-            if entity:
-                self.entities.append(entity)
-                self._index_documents(entity)
-                count += 1
+        for entity in un_entities:
+            self.entities.append(entity)
+            self._index_documents(entity)
+            count += 1
 
+        self._build_name_index()
         logger.info(f"✓ Loaded {count} UN entities")
         return count
 
@@ -641,8 +789,9 @@ class EnhancedSanctionsScreener:
                     }
                 )
 
-        entity["countries"] = list(set(entity["countries"]))
+        entity["countries"] = list(dict.fromkeys(entity["countries"]))
 
+        self._cache_match_fields(entity)
         return entity
 
     def _parse_un_entity(self, elem: Any) -> Optional[Dict[str, Any]]:
@@ -674,6 +823,7 @@ class EnhancedSanctionsScreener:
                 entity["aliases"].append(alias_name)
                 entity["all_names"].append(alias_name)
 
+        self._cache_match_fields(entity)
         return entity
 
     def _get_un_text(self, elem: Any, path: str) -> Optional[str]:
@@ -683,6 +833,82 @@ class EnhancedSanctionsScreener:
             return child.text.strip()
         return None
 
+    def _cache_match_fields(self, entity: Dict[str, Any]) -> None:
+        """Store query-invariant match data on the entity at load time
+
+        Adds the normalized names, the uppercased set of countries
+        (countries, nationality, citizenship) and the birth year so search()
+        never recomputes them per query.
+        """
+        entity["_norm_all_names"] = tuple(
+            self._normalize_name(n) for n in entity["all_names"]
+        )
+        countries = {c.upper() for c in entity.get("countries", [])}
+        for key in ("nationality", "citizenship"):
+            if entity.get(key):
+                countries.add(entity[key].upper())
+        entity["_countries_upper"] = frozenset(countries)
+        entity["_birth_year"] = self._extract_year(entity.get("dateOfBirth", ""))
+
+    def _build_name_index(self) -> None:
+        """Flatten all entity names into parallel lists for batched scoring
+
+        Position i holds a normalized candidate name with its tokens sorted
+        (what token_sort_ratio would compute on every call), its original
+        form, the index of the owning entity in self.entities and the name's
+        position within that entity's all_names. The lists are ordered by
+        normalized length so search() can restrict scoring to a contiguous
+        length window (see _length_window).
+
+        Also lays out the id, birth year, country set and the 4+ character
+        countries (for nationality substring matching) of every entity in
+        lists indexed like self.entities, so the scoring loop in search()
+        reads plain list slots and only touches the entity dict for results.
+        """
+        flat = [
+            (len(norm), idx, rank, norm, name)
+            for idx, entity in enumerate(self.entities)
+            for rank, (norm, name) in enumerate(
+                zip(entity["_norm_all_names"], entity["all_names"])
+            )
+        ]
+        flat.sort(key=lambda c: c[0])
+        self._candidate_lengths = [c[0] for c in flat]
+        self._candidate_owner = [c[1] for c in flat]
+        self._candidate_rank = [c[2] for c in flat]
+        self._candidate_sorted = [" ".join(sorted(c[3].split())) for c in flat]
+        self._candidate_names = [c[4] for c in flat]
+
+        self._entity_ids = [entity["id"] for entity in self.entities]
+        self._entity_birth_years = [entity["_birth_year"] for entity in self.entities]
+        self._entity_countries = [
+            entity["_countries_upper"] for entity in self.entities
+        ]
+        self._entity_countries_long = [
+            tuple(c for c in countries if len(c) >= 4)
+            for countries in self._entity_countries
+        ]
+
+    def _length_window(self, query_len: int, cutoff: float) -> Tuple[int, int]:
+        """Slice of the length-ordered candidates that can reach cutoff
+
+        The name score is 100 * (1 - indel / (len_a + len_b)) and the Indel
+        distance is at least the length difference, so a candidate of length
+        n can only score >= cutoff when
+        cutoff * q / (200 - cutoff) <= n <= q * (200 - cutoff) / cutoff.
+        Candidates outside that range are skipped without losing any match.
+        """
+        if cutoff <= 0:
+            return 0, len(self._candidate_lengths)
+        eps = 1e-9
+        lo = bisect.bisect_left(
+            self._candidate_lengths, cutoff * query_len / (200 - cutoff) - eps
+        )
+        hi = bisect.bisect_right(
+            self._candidate_lengths, query_len * (200 - cutoff) / cutoff + eps
+        )
+        return lo, hi
+
     def _index_documents(self, entity: Dict[str, Any]) -> None:
         """Index entity documents for fast lookup"""
         for doc in entity.get("identity_documents", []):
@@ -701,32 +927,49 @@ class EnhancedSanctionsScreener:
                 self._document_index[normalized] = []
             self._document_index[normalized].append(entity)
 
-    def _normalize_name(self, name: str) -> str:
-        """Normalize name for matching"""
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _normalize_name(name: str) -> str:
+        """Normalize name for matching
+
+        Memoized so repeated queries (e.g. duplicate rows in a bulk screen)
+        skip the Unicode and regex passes. Pure ASCII names have no accents
+        to strip and go through a translate table instead of the regex.
+        """
         if not name:
             return ""
-        # Remove accents
-        name = "".join(
-            c
-            for c in unicodedata.normalize("NFD", name)
-            if unicodedata.category(c) != "Mn"
-        )
-        # Remove special characters
-        name = re.sub(r"[^\w\s]", " ", name)
-        name = re.sub(r"\s+", " ", name)
-        return name.upper().strip()
+        if name.isascii():
+            name = name.translate(_ASCII_NAME_TABLE)
+        else:
+            # Remove accents
+            name = "".join(
+                c
+                for c in unicodedata.normalize("NFD", name)
+                if unicodedata.category(c) != "Mn"
+            )
+            # Remove special characters
+            name = _NAME_PUNCT_RE.sub(" ", name)
+        # Collapse whitespace
+        return " ".join(name.split()).upper()
 
     def _normalize_document(self, doc_number: str) -> str:
         """Normalize document number for matching"""
         if not doc_number:
             return ""
         # Remove spaces, dashes, dots
-        normalized = re.sub(r"[\s\-\.\,\/]", "", doc_number)
+        if doc_number.isascii():
+            normalized = doc_number.translate(_ASCII_DOC_TABLE)
+        else:
+            normalized = _DOC_SEPARATOR_RE.sub("", doc_number)
         return normalized.upper()
 
-    def _detect_unicode_script(self, name: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _detect_unicode_script(name: str) -> str:
         """Detect the primary Unicode script of a name
 
+        Memoized like _normalize_name; it only depends on the name.
+
         Returns:
             Script category: 'chinese', 'arabic', 'cyrillic', 'latin', 'mixed'
         """
@@ -761,7 +1004,9 @@ class EnhancedSanctionsScreener:
         else:
             return "mixed"
 
-    def _is_latin_initials(self, name: str) -> bool:
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _is_latin_initials(name: str) -> bool:
         """Check if name appears to be Latin initials like 'J.D.' or 'A.B.C.'"""
         # Remove dots and spaces
         cleaned = name.replace(".", "").replace(" ", "")
@@ -801,7 +1046,9 @@ class EnhancedSanctionsScreener:
             # Default Latin behavior
             return self.config.matching.short_name_threshold, "latin_default"
 
-    def _is_short_name(self, name: str) -> bool:
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _is_short_name(name: str) -> bool:
         """Check if name is considered short (requires stricter matching)"""
         words = name.split()
         if len(words) <= 2 and len(name) < 10:
@@ -918,116 +1165,179 @@ class EnhancedSanctionsScreener:
         weights = self.config.matching.weights
         layers = self.config.matching.layers
 
-        seen_entity_ids = set(r.entity["id"] for r in results)
-
-        for entity in self.entities:
-            if entity["id"] in seen_entity_ids:
-                continue
-
-            # Calculate name score
-            all_names = entity.get("all_names", [entity.get("name", "")])
-            best_name_score = 0.0
-            best_matched_name = ""
-
-            for candidate_name in all_names:
-                if not candidate_name:
-                    continue
-                candidate_norm = self._normalize_name(candidate_name)
-                score = fuzz.token_sort_ratio(query_norm, candidate_norm)
-                if score > best_name_score:
-                    best_name_score = score
-                    best_matched_name = candidate_name
+        seen_entity_ids = frozenset(r.entity["id"] for r in results)
+        # Min-heap of the best `limit` overall scores kept so far. A later
+        # candidate that does not beat its root can never reach the top-k
+        # (ties keep insertion order), so it is dropped before building flags.
+        top_scores = [r.confidence.overall for r in results]
+        heapq.heapify(top_scores)
+        while len(top_scores) > limit > 0:
+            heapq.heappop(top_scores)
+        # Token-sorted once so each candidate is scored with a plain ratio,
+        # which equals token_sort_ratio on the unsorted names
+        query_sorted = " ".join(sorted(query_norm.split()))
+
+        # Loop-invariant lookups hoisted out of the per-entity loop
+        w_name = weights["name"]
+        w_doc = weights["document"]
+        w_dob = weights["dob"]
+        high_conf = layers["high_confidence"]
+        mod_match = layers["moderate_match"]
+        thresholds = self.config.reporting.recommendation_thresholds
+        auto_escalate = thresholds["auto_escalate"]
+        manual_review = thresholds["manual_review"]
+        auto_clear = thresholds["auto_clear"]
+        input_doc_norm = (
+            self._normalize_document(input_data.document_number)
+            if input_data.document_number
+            else ""
+        )
+        # Entities holding the queried document, resolved once through the
+        # document index instead of rescanning every candidate's documents
+        doc_match_by_entity: Dict[str, str] = {}
+        if input_doc_norm:
+            normalize_document = self._normalize_document
+            for entity in self._document_index.get(input_doc_norm, []):
+                for doc in entity.get("identity_documents", []):
+                    if normalize_document(doc.get("number", "")) == input_doc_norm:
+                        doc_match_by_entity.setdefault(entity["id"], doc.get("number"))
+                        break
+        input_countries = [
+            c.upper() for c in (input_data.nationality, input_data.country) if c
+        ]
+        input_countries_set = frozenset(input_countries)
+        # Only country names of 4+ chars take part in substring matching
+        input_countries_long = tuple(c for c in input_countries if len(c) >= 4)
+        input_year = (
+            self._extract_year(input_data.date_of_birth)
+            if input_data.date_of_birth
+            else None
+        )
 
-            if best_name_score < layers["low_match"]:
-                continue
+        # Cheapest prefilter: without a document number an entity is only
+        # returned when its weighted score reaches base_threshold, so names
+        # that cannot get there even with a perfect DOB score are dropped
+        # inside rapidfuzz rather than in the loop below. A cutoff above 100
+        # means not even an identical name can get there.
+        name_cutoff = layers["low_match"]
+        if not input_doc_norm and w_name > 0:
+            max_dob = 100 * w_dob if input_data.date_of_birth else 0
+            name_floor = (base_threshold - max_dob) / w_name - 1e-9
+            name_cutoff = max(name_cutoff, name_floor)
+
+        # Score every candidate name that can still reach name_cutoff in one
+        # batched call, keeping the best name per entity (ties go to the
+        # name listed first in all_names)
+        owners = self._candidate_owner
+        ranks = self._candidate_rank
+        entity_ids = self._entity_ids
+        birth_years = self._entity_birth_years
+        best_by_entity: Dict[int, Tuple[float, int]] = {}
+        if name_cutoff <= 100:
+            lo, hi = self._length_window(len(query_norm), name_cutoff)
+            for _, score, i in process.extract(
+                query_sorted,
+                self._candidate_sorted[lo:hi],
+                scorer=fuzz.ratio,
+                score_cutoff=name_cutoff,
+                limit=None,
+            ):
+                pos = lo + i
+                owner = owners[pos]
+                best = best_by_entity.get(owner)
+                if best is None or (score == best[0] and ranks[pos] < ranks[best[1]]):
+                    best_by_entity[owner] = (score, pos)
+
+        # Walk entities in load order so equal scores keep a stable ordering.
+        # Entities already returned by the document layer are dropped once
+        # here; without a document number there are none to drop.
+        candidates = sorted(best_by_entity)
+        if seen_entity_ids:
+            candidates = [i for i in candidates if entity_ids[i] not in seen_entity_ids]
+        for entity_idx in candidates:
+            entity_id = entity_ids[entity_idx]
+
+            best_name_score, pos = best_by_entity[entity_idx]
+            best_matched_name = self._candidate_names[pos]
 
             # Calculate document score
             doc_score = 0.0
             matched_doc = None
-            if input_data.document_number:
-                input_doc_norm = self._normalize_document(input_data.document_number)
-                for doc in entity.get("identity_documents", []):
-                    if (
-                        self._normalize_document(doc.get("number", ""))
-                        == input_doc_norm
-                    ):
-                        doc_score = 100.0
-                        matched_doc = doc.get("number")
-                        break
+            if entity_id in doc_match_by_entity:
+                doc_score = 100.0
+                matched_doc = doc_match_by_entity[entity_id]
 
-            # Calculate DOB score
+            # Calculate DOB score on years parsed once per query and once
+            # per entity at load time
             dob_score = 0.0
-            if input_data.date_of_birth and entity.get("dateOfBirth"):
-                dob_score = self._calculate_dob_score(
-                    input_data.date_of_birth, entity["dateOfBirth"]
-                )
+            birth_year = birth_years[entity_idx]
+            if input_year and birth_year:
+                dob_score = _dob_score_from_years(input_year, birth_year)
+
+            # Calculate overall score using weights
+            # NOTE: nationality is now INFORMATIONAL ONLY and excluded from scoring
+            # The weighted sum maintains consistency with original formula (without nat_score component)
+            overall = (
+                best_name_score * w_name
+                + doc_score * w_doc
+                + dob_score * w_dob
+                # nationality weight removed - it's informational only
+            )
+            # Note: With current weights (0.40 + 0.30 + 0.15 = 0.85),
+            # max possible score is 85. This is intentional - the remaining
+            # 0.15 weight (0.10 nationality + 0.05 address) represents fields
+            # that are informational-only or not used in scoring.
+
+            # Scores are 0-100 and weights are validated as non-negative, so
+            # only the 0.01 tolerance on the weights sum can exceed 100
+            overall = min(100, overall)
+
+            # Check if meets threshold before building anything else for the
+            # entity; most candidates above low_match stop here
+            if not (overall >= base_threshold or doc_score == 100):
+                continue
+            if limit > 0:
+                if len(top_scores) < limit:
+                    heapq.heappush(top_scores, overall)
+                elif overall > top_scores[0]:
+                    heapq.heapreplace(top_scores, overall)
+                else:
+                    continue
+
+            entity = self.entities[entity_idx]
 
             # Nationality check - INFORMATIONAL FLAG ONLY (non-scoring)
             # This data point is solely for human review/analysis; it does NOT affect the score
             nat_flag = None  # Will be set to appropriate flag if match found
-            if input_data.nationality or input_data.country:
-                input_countries = []
-                if input_data.nationality:
-                    input_countries.append(input_data.nationality.upper())
-                if input_data.country:
-                    input_countries.append(input_data.country.upper())
-
-                entity_countries = set(c.upper() for c in entity.get("countries", []))
-                entity_nat = entity.get("nationality", "")
-                entity_cit = entity.get("citizenship", "")
-
-                if entity_nat:
-                    entity_countries.add(entity_nat.upper())
-                if entity_cit:
-                    entity_countries.add(entity_cit.upper())
+            if input_countries:
+                # Uppercased country set precomputed at load time
+                entity_countries = self._entity_countries[entity_idx]
 
                 # Check for any match - optimized using set intersection first
-                input_countries_set = set(input_countries)
                 if input_countries_set & entity_countries:
                     # Exact match found via set intersection
                     nat_flag = "NATIONALITY_EXACT_MATCH_INFO"
-                elif entity_countries:
+                elif input_countries_long:
                     # Check for meaningful substring matches only if no exact match
                     # Avoid false positives like USA matching JERUSALEM
                     # A substring match is only valid if:
-                    # 1. The shorter string is at least 4 chars (to avoid false positives)
+                    # 1. Both strings are at least 4 chars (to avoid false positives)
                     # 2. One is a prefix or suffix of the other (not just contained)
-                    found_substring = False
-                    for ic in input_countries:
-                        for ec in entity_countries:
-                            # Only consider substring matches for longer country names
-                            # This avoids "USA" matching "JERUSALEM" (false positive)
-                            min_len = min(len(ic), len(ec))
-                            if min_len >= 4:  # Minimum length for substring match
-                                # Check if one starts with or ends with the other
-                                if ec.startswith(ic) or ec.endswith(ic):
-                                    found_substring = True
-                                    break
-                                if ic.startswith(ec) or ic.endswith(ec):
-                                    found_substring = True
-                                    break
-                        if found_substring:
-                            break
-                    if found_substring:
+                    # startswith/endswith take a tuple, testing every pair in C
+                    entity_long = self._entity_countries_long[entity_idx]
+                    if any(
+                        ec.startswith(input_countries_long)
+                        or ec.endswith(input_countries_long)
+                        for ec in entity_long
+                    ) or any(
+                        ic.startswith(entity_long) or ic.endswith(entity_long)
+                        for ic in input_countries_long
+                    ):
                         nat_flag = "NATIONALITY_SUBSTRING_MATCH_INFO"
                     # NOTE: No penalty for nationality mismatch - this is informational only
 
-            # Calculate overall score using weights
-            # NOTE: nationality is now INFORMATIONAL ONLY and excluded from scoring
-            # The weighted sum maintains consistency with original formula (without nat_score component)
-            overall = (
-                best_name_score * weights["name"]
-                + doc_score * weights["document"]
-                + dob_score * weights["dob"]
-                # nationality weight removed - it's informational only
-            )
-            # Note: With current weights (0.40 + 0.30 + 0.15 = 0.85),
-            # max possible score is 85. This is intentional - the remaining
-            # 0.15 weight (0.10 nationality + 0.05 address) represents fields
-            # that are informational-only or not used in scoring.
-
             confidence = ConfidenceBreakdown(
-                overall=max(0, min(100, overall)),
+                overall=overall,
                 name_score=best_name_score,
                 document_score=doc_score,
                 dob_score=dob_score,
@@ -1041,12 +1351,12 @@ class EnhancedSanctionsScreener:
             if doc_score == 100:
                 layer = 1
                 flags.append("DOCUMENT_MATCH")
-            elif best_name_score >= layers["high_confidence"]:
+            elif best_name_score >= high_conf:
                 if nat_flag or dob_score >= 60:
                     layer = 2
                 else:
                     layer = 3
-            elif best_name_score >= layers["moderate_match"]:
+            elif best_name_score >= mod_match:
                 layer = 3
             else:
                 layer = 4
@@ -1071,12 +1381,11 @@ class EnhancedSanctionsScreener:
                 flags.append("ENTITY_MATCH")
 
             # Determine recommendation
-            thresholds = self.config.reporting.recommendation_thresholds
-            if confidence.overall >= thresholds["auto_escalate"]:
+            if confidence.overall >= auto_escalate:
                 recommendation = "AUTO_ESCALATE"
-            elif confidence.overall >= thresholds["manual_review"]:
+            elif confidence.overall >= manual_review:
                 recommendation = "MANUAL_REVIEW"
-            elif confidence.overall >= thresholds["auto_clear"]:
+            elif confidence.overall >= auto_clear:
                 recommendation = "LOW_CONFIDENCE_REVIEW"
             else:
                 recommendation = "AUTO_CLEAR"
@@ -1087,9 +1396,8 @@ class EnhancedSanctionsScreener:
                     recommendation = "MANUAL_REVIEW"
                 flags.append("COMMON_NAME_REQUIRES_SECONDARY_VALIDATION")
 
-            # Check if meets threshold
-            if confidence.overall >= base_threshold or doc_score == 100:
-                result = MatchResult(
+            results.append(
+                MatchResult(
                     entity=entity,
                     confidence=confidence,
                     flags=flags,
@@ -1098,12 +1406,10 @@ class EnhancedSanctionsScreener:
                     matched_name=best_matched_name,
                     matched_document=matched_doc,
                 )
-                results.append(result)
-
-        # Sort by confidence
-        results.sort(key=lambda x: x.confidence.overall, reverse=True)
+            )
 
-        return results[:limit]
+        # Top-k by confidence; equivalent to a stable descending sort + slice
+        return heapq.nlargest(limit, results, key=lambda x: x.confidence.overall)
 
     def _calculate_dob_score(self, input_dob: str, entity_dob: str) -> float:
         """Calculate DOB similarity score
@@ -1116,8 +1422,7 @@ class EnhancedSanctionsScreener:
             entity_year = self._extract_year(entity_dob)
 
             if input_year and entity_year:
-                diff = abs(input_year - entity_year)
-                return max(0, 100 - (diff * 20))
+                return _dob_score_from_years(input_year, entity_year)
         except Exception:
             pass
 
@@ -1128,20 +1433,8 @@ class EnhancedSanctionsScreener:
         if not date_str:
             return None
 
-        # Try common formats
-        patterns = [
-            r"(\d{4})",  # Just year
-            r"(\d{4})-\d{2}-\d{2}",  # ISO format
-            r"\d{2}/\d{2}/(\d{4})",  # MM/DD/YYYY
-            r"\d{2}-\d{2}-(\d{4})",  # DD-MM-YYYY
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, date_str)
-            if match:
-                return int(match.group(1))
-
-        return None
+        match = _YEAR_RE.search(date_str)
+        return int(match.group()) if match else None
 
     def screen_individual(
         self,
@@ -1169,6 +1462,34 @@ class EnhancedSanctionsScreener:
         Returns:
             Complete screening result dictionary
         """
+        result, matches = self._run_screening(
+            name, document, document_type, date_of_birth, nationality, country, analyst
+        )
+
+        # The deque's maxlen drops the oldest entry once the limit is reached
+        self.screening_history.append(result)
+
+        # Generate reports if requested
+        if generate_report:
+            result["report_files"] = self._generate_reports(result, matches)
+
+        return result
+
+    def _run_screening(
+        self,
+        name: str,
+        document: Optional[str] = None,
+        document_type: Optional[str] = None,
+        date_of_birth: Optional[str] = None,
+        nationality: Optional[str] = None,
+        country: Optional[str] = None,
+        analyst: Optional[str] = None,
+    ) -> Tuple[Dict[str, Any], List[MatchResult]]:
+        """Search for an individual and build the screening result
+
+        Returns:
+            Screening result dictionary and the matches it was built from
+        """
         screening_id = str(uuid.uuid4())
         screening_date = datetime.now()
 
@@ -1206,17 +1527,7 @@ class EnhancedSanctionsScreener:
             },
         }
 
-        # Add to history with size limit to prevent memory issues
-        self.screening_history.append(result)
-        if len(self.screening_history) > self._max_history_size:
-            # Remove oldest entries when limit exceeded
-            self.screening_history = self.screening_history[-self._max_history_size :]
-
-        # Generate reports if requested
-        if generate_report:
-            result["report_files"] = self._generate_reports(result, matches)
-
-        return result
+        return result, matches
 
     def _generate_reports(
         self, result: Dict[str, Any], matches: List[MatchResult]
@@ -1269,8 +1580,16 @@ class EnhancedSanctionsScreener:
                 analyst_name=result.get("analyst"),
             )
 
-            generator = ConstanciaReportGenerator(self.reports_dir)
-            metadata = ReportMetadataCollector(self.data_dir).collect_all_metadata()
+            # Collecting metadata parses and hashes the list files, so it is
+            # done once rather than for every report
+            if self._report_generator is None:
+                self._report_generator = ConstanciaReportGenerator(self.reports_dir)
+            if self._report_metadata is None:
+                self._report_metadata = ReportMetadataCollector(
+                    self.data_dir
+                ).collect_all_metadata()
+            generator = self._report_generator
+            metadata = self._report_metadata
 
             report_files["html"] = generator.generate_html_report(
                 screening_result, metadata
@@ -1286,11 +1605,33 @@ class EnhancedSanctionsScreener:
 
         return report_files
 
+    @staticmethod
+    def _iter_bulk_jobs(reader: csv.DictReader, analyst: Optional[str]):
+        """Yield (row number, _run_screening kwargs) for each named CSV row
+
+        Rows are streamed from the reader.
+        """
+        for idx, row in enumerate(reader, 1):
+            nombre = row.get("nombre", "").strip()
+            cedula = row.get("cedula", "").strip()
+            pais = row.get("pais", "").strip()
+
+            if not nombre:
+                continue
+
+            yield idx, {
+                "name": nombre,
+                "document": cedula if cedula else None,
+                "country": pais if pais else None,
+                "analyst": analyst,
+            }
+
     def bulk_screen(
         self,
         csv_file: str,
         analyst: Optional[str] = None,
         generate_individual_reports: bool = False,
+        max_workers: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Bulk screening from CSV file
 
@@ -1298,6 +1639,9 @@ class EnhancedSanctionsScreener:
             csv_file: Path to CSV file with columns: nombre,cedula,pais
             analyst: Analyst name
             generate_individual_reports: Generate individual reports
+            max_workers: Worker processes used to screen rows in parallel.
+                None or 1 screens in the calling process. Reports are
+                always written by the calling process.
 
         Returns:
             Summary of bulk screening
@@ -1309,36 +1653,53 @@ class EnhancedSanctionsScreener:
         logger.info(f"BULK SCREENING - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         logger.info(f"{'='*60}\n")
 
-        with open(csv_file, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-            total = len(rows)
-
-            for idx, row in enumerate(rows, 1):
-                nombre = row.get("nombre", "").strip()
-                cedula = row.get("cedula", "").strip()
-                pais = row.get("pais", "").strip()
-
-                if not nombre:
-                    continue
-
-                logger.info(f"[{idx}/{total}] Screening: {nombre}...")
-
-                result = self.screen_individual(
-                    name=nombre,
-                    document=cedula if cedula else None,
-                    country=pais if pais else None,
-                    analyst=analyst,
-                    generate_report=generate_individual_reports,
-                )
-
+        def collect(screened):
+            # Bulk results are returned in the summary, so they are not also
+            # kept in screening_history. Reports are written here, in this
+            # process: each one also rewrites the shared audit log HTML.
+            for (idx, kwargs), (result, matches) in screened:
+                if generate_individual_reports:
+                    result["report_files"] = self._generate_reports(result, matches)
                 results.append(result)
 
+                # Log hits individually and clear rows only as progress
                 if result["is_hit"]:
                     hits.append(result)
-                    logger.info(f"  ⚠️  HIT - {result['hit_count']} matches")
-                else:
-                    logger.info(f"  ✓ Clear")
+                    logger.info(
+                        "[%d] %s ⚠️  HIT - %d matches",
+                        idx,
+                        kwargs["name"],
+                        result["hit_count"],
+                    )
+                if len(results) % BULK_LOG_INTERVAL == 0:
+                    logger.info("Screened %d rows, %d hits", len(results), len(hits))
+
+        with open(csv_file, "r", encoding="utf-8", newline="") as f:
+            jobs = self._iter_bulk_jobs(csv.DictReader(f), analyst)
+
+            if max_workers and max_workers > 1:
+                # Rows are independent and CPU-bound on fuzzy scoring. Workers
+                # receive this screener once through the pool initializer and
+                # results come back in CSV order. pool.map submits every row
+                # up front, so the jobs are collected here.
+                jobs = list(jobs)
+                chunksize = max(1, len(jobs) // (max_workers * 4))
+                with ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_bulk_worker,
+                    initargs=(self,),
+                ) as pool:
+                    screened = pool.map(
+                        functools.partial(
+                            _screen_bulk_row,
+                            keep_matches=generate_individual_reports,
+                        ),
+                        [kwargs for _, kwargs in jobs],
+                        chunksize=chunksize,
+                    )
+                    collect(zip(jobs, screened))
+            else:
+                collect((job, self._run_screening(**job[1])) for job in jobs)
 
         # Save summary
         summary = {
@@ -1357,8 +1718,11 @@ class EnhancedSanctionsScreener:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         summary_file = self.reports_dir / f"bulk_screening_{timestamp}.json"
 
-        with open(summary_file, "w", encoding="utf-8") as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+        if HAS_ORJSON:
+            summary_file.write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+        else:
+            with open(summary_file, "w", encoding="utf-8") as f:
+                json.dump(summary, f, indent=2, ensure_ascii=False)
 
         logger.info(f"\n{'='*60}")
         logger.info(f"SCREENING SUMMARY")
@@ -1371,6 +1735,32 @@ class EnhancedSanctionsScreener:
         return summary
 
 
+# Screener used by bulk_screen worker processes (set by _init_bulk_worker)
+_bulk_worker_screener: Optional[EnhancedSanctionsScreener] = None
+
+
+def _init_bulk_worker(screener: EnhancedSanctionsScreener) -> None:
+    """Process pool initializer: keep the parent's screener for this worker"""
+    global _bulk_worker_screener
+    _bulk_worker_screener = screener
+
+
+def _screen_bulk_row(
+    kwargs: Dict[str, Any], keep_matches: bool
+) -> Tuple[Dict[str, Any], List[MatchResult]]:
+    """Screen one bulk CSV row inside a worker process
+
+    Matches are only sent back to the parent when it writes reports from
+    them, and without the entities' underscore match caches.
+    """
+    result, matches = _bulk_worker_screener._run_screening(**kwargs)
+    if not keep_matches:
+        return result, []
+    for m in matches:
+        m.entity = {k: v for k, v in m.entity.items() if not k.startswith("_")}
+    return result, matches
+
+
 def main():
     """Main entry point"""
     print("=== Enhanced Sanctions Screener v2.0 ===\n")
@@ -1386,8 +1776,16 @@ def main():
     csv_path = Path("input.csv")
     if csv_path.exists():
         print(f"\nStarting bulk screening from {csv_path}...")
+        performance = screener.config.performance
         summary = screener.bulk_screen(
-            csv_file=str(csv_path), analyst=None, generate_individual_reports=True
+            csv_file=str(csv_path),
+            analyst=None,
+            generate_individual_reports=True,
+            max_workers=(
+                min(performance.max_threads, os.cpu_count() or 1)
+                if performance.concurrent_searches
+                else None
+            ),
         )
         EnhancedSanctionsScreener.test_postgres_connection()
 
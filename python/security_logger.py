@@ -10,16 +10,45 @@ Provides structured logging for security-related events including:
 SECURITY: Ensures sensitive data is sanitized before logging.
 """
 
+import atexit
 import logging
+import logging.handlers
 import json
+import queue
 import uuid
+from contextvars import ContextVar
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass, field as dataclass_field
 
+from xml_utils import sanitize_for_logging
 
-@dataclass
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Logging level for each SecurityEvent severity (anything else is WARNING)
+_SEVERITY_LEVELS = {"CRITICAL": logging.CRITICAL, "ERROR": logging.ERROR}
+
+# Current request context as (request_id, user_id, source_ip). A ContextVar
+# keeps concurrent threads/tasks sharing the security logger apart.
+_REQUEST_CONTEXT: ContextVar[Tuple[str, str, str]] = ContextVar(
+    "security_request_context", default=("", "", "")
+)
+
+# Event types for the documented injection types; others are built on demand
+_INJECTION_EVENTS = {
+    "SQL": "SQL_INJECTION_ATTEMPT",
+    "LOG": "LOG_INJECTION_ATTEMPT",
+    "COMMAND": "COMMAND_INJECTION_ATTEMPT",
+}
+
+
+@dataclass(slots=True)
 class SecurityEvent:
     """Structured security event for logging"""
 
@@ -54,8 +83,36 @@ class SecurityEvent:
         }
 
     def to_json(self) -> str:
-        """Convert to JSON string"""
-        return json.dumps(self.to_dict(), ensure_ascii=False)
+        """Convert to a compact JSON string (non-ASCII kept as is)"""
+        data = self.to_dict()
+        if HAS_ORJSON:
+            try:
+                return orjson.dumps(data).decode("utf-8")
+            except TypeError:
+                pass  # e.g. an integer wider than 64 bits in the context
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+class _BurstFileHandler(logging.FileHandler):
+    """FileHandler that flushes once the queue it is fed from runs dry
+
+    Used behind SecurityLogger's QueueListener. Records go into the file
+    object's buffer and are flushed when no further record is waiting, so
+    a burst of events reaches the disk in a few large writes instead of one
+    write() per event, while an isolated event is still flushed at once.
+    """
+
+    def __init__(self, filename: Path, log_queue: queue.SimpleQueue, **kwargs):
+        super().__init__(filename, **kwargs)
+        self._queue = log_queue
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if self._queue.empty():
+                self.flush()
+        except Exception:
+            self.handleError(record)
 
 
 class SecurityLogger:
@@ -63,10 +120,13 @@ class SecurityLogger:
 
     Features:
     - Separate security.log file
-    - JSON-formatted events for easy parsing
+    - JSON-formatted events for easy parsing (the SecurityEvent itself is
+      attached to each record as ``record.security_event`` for handlers
+      that want the fields without re-parsing the message)
     - Automatic sanitization of sensitive data
     - Request ID correlation
     - Log rotation support (via external log rotation tools)
+    - Optional background writer thread (use_queue=True)
     """
 
     def __init__(
@@ -75,6 +135,7 @@ class SecurityLogger:
         log_level: int = logging.WARNING,
         enable_console: bool = False,
         enable_file: bool = True,
+        use_queue: bool = False,
     ):
         """Initialize security logger
 
@@ -83,6 +144,10 @@ class SecurityLogger:
             log_level: Minimum log level to record
             enable_console: Also output to console
             enable_file: Write to security.log file
+            use_queue: Hand events to a background thread that writes them,
+                so callers do not wait on file I/O. Events reach the handlers
+                asynchronously; close() flushes them and is also run at
+                interpreter exit.
         """
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
@@ -97,25 +162,58 @@ class SecurityLogger:
             "%(asctime)s - SECURITY - %(levelname)s - %(message)s"
         )
 
+        self._handlers: List[logging.Handler] = []
+        log_queue: Optional[queue.SimpleQueue] = None
+        if use_queue and (enable_file or enable_console):
+            log_queue = queue.SimpleQueue()
+
         if enable_file:
             # File handler for security events
             security_log_path = self.log_dir / "security.log"
-            file_handler = logging.FileHandler(security_log_path, encoding="utf-8")
+            if log_queue is not None:
+                file_handler: logging.FileHandler = _BurstFileHandler(
+                    security_log_path, log_queue, encoding="utf-8"
+                )
+            else:
+                file_handler = logging.FileHandler(security_log_path, encoding="utf-8")
             file_handler.setLevel(log_level)
             file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
+            self._handlers.append(file_handler)
 
         if enable_console:
             # Console handler
             console_handler = logging.StreamHandler()
             console_handler.setLevel(log_level)
             console_handler.setFormatter(formatter)
-            self.logger.addHandler(console_handler)
-
-        # Track current request context
-        self._request_id: str = ""
-        self._user_id: str = ""
-        self._source_ip: str = ""
+            self._handlers.append(console_handler)
+
+        self._queue_handler: Optional[logging.handlers.QueueHandler] = None
+        self._listener: Optional[logging.handlers.QueueListener] = None
+        if log_queue is not None:
+            self._queue_handler = logging.handlers.QueueHandler(log_queue)
+            self.logger.addHandler(self._queue_handler)
+            self._listener = logging.handlers.QueueListener(
+                log_queue, *self._handlers, respect_handler_level=True
+            )
+            self._listener.start()
+            # The listener thread is a daemon; flush queued events at exit
+            atexit.register(self.close)
+        else:
+            for handler in self._handlers:
+                self.logger.addHandler(handler)
+
+    def close(self) -> None:
+        """Write out any queued events and close the log handlers"""
+        if self._listener is not None:
+            self.logger.removeHandler(self._queue_handler)
+            self._listener.stop()
+            self._listener = None
+            self._queue_handler = None
+            atexit.unregister(self.close)
+        for handler in self._handlers:
+            self.logger.removeHandler(handler)
+            handler.close()
+        self._handlers = []
 
     def set_request_context(
         self, request_id: Optional[str] = None, user_id: str = "", source_ip: str = ""
@@ -130,16 +228,13 @@ class SecurityLogger:
         Returns:
             The request ID being used
         """
-        self._request_id = request_id or f"REQ-{uuid.uuid4().hex[:8]}"
-        self._user_id = user_id
-        self._source_ip = source_ip
-        return self._request_id
+        request_id = request_id or f"REQ-{uuid.uuid4().hex[:8]}"
+        _REQUEST_CONTEXT.set((request_id, user_id, source_ip))
+        return request_id
 
     def clear_request_context(self) -> None:
         """Clear the current request context"""
-        self._request_id = ""
-        self._user_id = ""
-        self._source_ip = ""
+        _REQUEST_CONTEXT.set(("", "", ""))
 
     def _sanitize_input(self, text: str, max_length: int = 50) -> str:
         """Sanitize input for safe logging
@@ -154,8 +249,6 @@ class SecurityLogger:
         Returns:
             Sanitized text safe for logging
         """
-        from xml_utils import sanitize_for_logging
-
         if not text:
             return ""
         # Use shared sanitization logic
@@ -236,6 +329,11 @@ class SecurityLogger:
             source: Source module/function
             additional_context: Additional context data (will be sanitized)
         """
+        # Skip sanitizing and serializing events the logger would drop
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
+
+        request_id, user_id, source_ip = _REQUEST_CONTEXT.get()
         event = SecurityEvent(
             event_type="VALIDATION_FAILED",
             severity="WARNING",
@@ -243,13 +341,13 @@ class SecurityLogger:
             error_code=error_code,
             sanitized_input=self._sanitize_input(input_value),
             source=source,
-            request_id=self._request_id,
-            user_id=self._user_id,
-            source_ip=self._source_ip,
+            request_id=request_id,
+            user_id=user_id,
+            source_ip=source_ip,
             additional_context=self._sanitize_context(additional_context),
         )
 
-        self.logger.warning(event.to_json())
+        self.logger.warning(event.to_json(), extra={"security_event": event})
 
     def log_security_event(
         self,
@@ -274,10 +372,15 @@ class SecurityLogger:
             blocked: Whether the attempt was blocked
             additional_context: Additional context (will be sanitized)
         """
+        level = _SEVERITY_LEVELS.get(severity, logging.WARNING)
+        if not self.logger.isEnabledFor(level):
+            return
+
         # Sanitize context first, then add blocked status
         context = self._sanitize_context(additional_context)
         context["blocked"] = blocked
 
+        request_id, user_id, source_ip = _REQUEST_CONTEXT.get()
         event = SecurityEvent(
             event_type=event_type,
             severity=severity,
@@ -285,18 +388,13 @@ class SecurityLogger:
             error_code=error_code,
             sanitized_input=self._sanitize_input(input_value),
             source=source,
-            request_id=self._request_id,
-            user_id=self._user_id,
-            source_ip=self._source_ip,
+            request_id=request_id,
+            user_id=user_id,
+            source_ip=source_ip,
             additional_context=context,
         )
 
-        if severity == "CRITICAL":
-            self.logger.critical(event.to_json())
-        elif severity == "ERROR":
-            self.logger.error(event.to_json())
-        else:
-            self.logger.warning(event.to_json())
+        self.logger.log(level, event.to_json(), extra={"security_event": event})
 
     def log_xxe_attempt(
         self, source: str = "XML parsing", file_name: str = "", blocked: bool = True
@@ -333,8 +431,11 @@ class SecurityLogger:
             source: Source module/function
             blocked: Whether the attempt was blocked
         """
+        event_type = _INJECTION_EVENTS.get(injection_type)
+        if event_type is None:
+            event_type = f"{injection_type.upper()}_INJECTION_ATTEMPT"
         self.log_security_event(
-            event_type=f"{injection_type.upper()}_INJECTION_ATTEMPT",
+            event_type=event_type,
             severity="ERROR",
             field=field,
             input_value=input_value,
@@ -348,13 +449,14 @@ _security_logger: Optional[SecurityLogger] = None
 
 
 def get_security_logger(
-    log_dir: str = "logs", enable_console: bool = False
+    log_dir: str = "logs", enable_console: bool = False, use_queue: bool = False
 ) -> SecurityLogger:
     """Get or create the global security logger instance
 
     Args:
         log_dir: Directory for log files
         enable_console: Also output to console
+        use_queue: Write events from a background thread (see SecurityLogger)
 
     Returns:
         SecurityLogger instance
@@ -362,7 +464,7 @@ def get_security_logger(
     global _security_logger
     if _security_logger is None:
         _security_logger = SecurityLogger(
-            log_dir=log_dir, enable_console=enable_console
+            log_dir=log_dir, enable_console=enable_console, use_queue=use_queue
         )
     return _security_logger
 
@@ -370,4 +472,6 @@ def get_security_logger(
 def reset_security_logger() -> None:
     """Reset the global security logger (for testing)"""
     global _security_logger
+    if _security_logger is not None:
+        _security_logger.close()
     _security_logger = None
@@ -17,78 +17,131 @@ Environment Variables:
 
 import os
 import sys
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-def test_basic_connection():
+# Tables the init script creates, in the order they are reported
+_EXPECTED_TABLES = (
+    'sanctioned_entities',
+    'entity_aliases',
+    'identity_documents',
+    'entity_addresses',
+    'entity_features',
+    'sanctions_programs',
+    'entity_programs',
+    'screening_requests',
+    'screening_results',
+    'screening_matches',
+    'audit_logs',
+    'data_sources',
+    'data_updates',
+)
+
+# Extensions the schema depends on
+_REQUIRED_EXTENSIONS = ('uuid-ossp', 'pg_trgm')
+
+# Shared psycopg2 connection pool, created on first use and closed by main()
+_pool = None
+
+# Public tables and installed extensions, fetched once by _fetch_schema_snapshot()
+_schema_snapshot = None
+
+@lru_cache(maxsize=1)
+def _conn_kwargs():
+    """Build psycopg2 connection parameters from the DB_* environment variables.
+    
+    The environment is read once; the port is parsed to an int here.
+    """
+    return {
+        "host": os.getenv("DB_HOST", "localhost"),
+        "port": int(os.getenv("DB_PORT", "5432")),
+        "database": os.getenv("DB_NAME", "sdn_database"),
+        "user": os.getenv("DB_USER", "sdn_user"),
+        "password": os.getenv("DB_PASSWORD", "sdn_password"),
+    }
+
+def _get_pool():
+    """Return the shared connection pool, connecting on first use."""
+    global _pool
+    if _pool is None:
+        from psycopg2.pool import ThreadedConnectionPool
+        
+        _pool = ThreadedConnectionPool(minconn=1, maxconn=2, **_conn_kwargs())
+    return _pool
+
+def _close_pool():
+    """Close all connections held by the shared pool."""
+    global _pool
+    if _pool is not None:
+        _pool.closeall()
+        _pool = None
+
+@contextmanager
+def _connection():
+    """Borrow a connection from the shared pool for the duration of a block."""
+    pool = _get_pool()
+    conn = pool.getconn()
+    try:
+        yield conn
+    finally:
+        pool.putconn(conn)
+
+def _fetch_schema_snapshot():
+    """Fetch public tables and installed extensions in a single query.
+    
+    The result is cached so check_schema_tables and check_extensions share
+    one round trip to the server.
+    """
+    global _schema_snapshot
+    if _schema_snapshot is None:
+        with _connection() as conn, conn.cursor() as cursor:
+            cursor.execute("""
+                SELECT 'table', table_name::text
+                FROM information_schema.tables 
+                WHERE table_schema = 'public' 
+                AND table_type = 'BASE TABLE'
+                UNION ALL
+                SELECT 'ext', extname::text FROM pg_extension
+                ORDER BY 1, 2;
+            """)
+            snapshot = {"table": [], "ext": []}
+            for kind, name in cursor.fetchall():
+                snapshot[kind].append(name)
+        _schema_snapshot = snapshot
+    return _schema_snapshot
+
+def check_basic_connection():
     """Test basic PostgreSQL connection using psycopg2."""
     print("\n" + "=" * 60)
     print("🔍 Testing Basic PostgreSQL Connection")
     print("=" * 60)
     
     try:
-        import psycopg2
+        params = _conn_kwargs()
         
-        host = os.getenv("DB_HOST", "localhost")
-        port = os.getenv("DB_PORT", "5432")
-        database = os.getenv("DB_NAME", "sdn_database")
-        user = os.getenv("DB_USER", "sdn_user")
-        password = os.getenv("DB_PASSWORD", "sdn_password")
+        print(f"\n📡 Connecting to: {params['host']}:{params['port']}/{params['database']}")
+        print(f"👤 User: {params['user']}")
         
-        print(f"\n📡 Connecting to: {host}:{port}/{database}")
-        print(f"👤 User: {user}")
-        
-        conn = psycopg2.connect(
-            host=host,
-            port=port,
-            database=database,
-            user=user,
-            password=password
-        )
-        
-        cursor = conn.cursor()
-        cursor.execute("SELECT version();")
-        version = cursor.fetchone()[0]
+        with _connection() as conn, conn.cursor() as cursor:
+            cursor.execute("SELECT version();")
+            version = cursor.fetchone()[0]
         
         print(f"\n✅ CONNECTION SUCCESSFUL TO POSTGRESQL")
         print(f"📊 Database Version: {version}")
         
-        cursor.close()
-        conn.close()
-    password = os.getenv("DB_PASSWORD", "sdn_password")
-    
-    print(f"\n📡 Connecting to: {host}:{port}/{database}")
-    print(f"👤 User: {user}")
-    
-    conn = psycopg2.connect(
-        host=host,
-        port=port,
-        database=database,
-        user=user,
-        password=password
-    )
-    
-    cursor = conn.cursor()
-    cursor.execute("SELECT version();")
-    version = cursor.fetchone()[0]
-    
-    print(f"\n✅ CONNECTION SUCCESSFUL TO POSTGRESQL")
-    print(f"📊 Database Version: {version}")
-    
-    cursor.close()
-    conn.close()
-    return True
-    
-except ImportError:
-    print("❌ psycopg2 not installed. Install with: pip install psycopg2-binary")
-    return False
-except Exception as e:
-    print(f"\n❌ Connection failed: {e}")
-    return False
+        return True
+    except ImportError:
+        print("❌ psycopg2 not installed. Install with: pip install psycopg2-binary")
+        return False
+    except Exception as e:
+        print(f"\n❌ Connection failed: {e}")
+        return False
 
-def test_sqlalchemy_connection():
+def check_sqlalchemy_connection():
     """Test SQLAlchemy connection and ORM setup."""
     print("\n" + "=" * 60)
     print("🔍 Testing SQLAlchemy Connection")
@@ -123,62 +176,20 @@ def test_sqlalchemy_connection():
         print(f"\n❌ SQLAlchemy test failed: {e}")
         return False
 
-def test_schema_tables():
+def check_schema_tables():
     """Verify database schema tables exist."""
     print("\n" + "=" * 60)
     print("🔍 Verifying Database Schema")
     print("=" * 60)
     
-    expected_tables = [
-        'sanctioned_entities',
-        'entity_aliases',
-        'identity_documents',
-        'entity_addresses',
-        'entity_features',
-        'sanctions_programs',
-        'entity_programs',
-        'screening_requests',
-        'screening_results',
-        'screening_matches',
-        'audit_logs',
-        'data_sources',
-        'data_updates'
-    ]
-    
     try:
-        import psycopg2
-        
-        host = os.getenv("DB_HOST", "localhost")
-        port = os.getenv("DB_PORT", "5432")
-        database = os.getenv("DB_NAME", "sdn_database")
-        user = os.getenv("DB_USER", "sdn_user")
-        password = os.getenv("DB_PASSWORD", "sdn_password")
-        
-        conn = psycopg2.connect(
-            host=host,
-            port=port,
-            database=database,
-            user=user,
-            password=password
-        )
-        
-        cursor = conn.cursor()
-        
         # Get all tables in public schema
-        cursor.execute("""
-            SELECT table_name 
-            FROM information_schema.tables 
-            WHERE table_schema = 'public' 
-            AND table_type = 'BASE TABLE'
-            ORDER BY table_name;
-        """)
-        
-        existing_tables = [row[0] for row in cursor.fetchall()]
+        existing_tables = set(_fetch_schema_snapshot()["table"])
         
         print(f"\n📋 Found {len(existing_tables)} tables in database:")
         
         all_present = True
-        for table in expected_tables:
+        for table in _EXPECTED_TABLES:
             if table in existing_tables:
                 print(f"  ✅ {table}")
             else:
@@ -186,17 +197,14 @@ def test_schema_tables():
                 all_present = False
         
         # Check for any extra tables
-        extra_tables = set(existing_tables) - set(expected_tables)
+        extra_tables = existing_tables.difference(_EXPECTED_TABLES)
         if extra_tables:
             print(f"\n📋 Additional tables found:")
-            for table in extra_tables:
+            for table in sorted(extra_tables):
                 print(f"  ℹ️  {table}")
         
-        cursor.close()
-        conn.close()
-        
         if all_present:
-            print(f"\n✅ All {len(expected_tables)} expected tables are present!")
+            print(f"\n✅ All {len(_EXPECTED_TABLES)} expected tables are present!")
         else:
             print("\n⚠️ Some tables are missing. Run the init script.")
         
@@ -208,96 +216,62 @@ def test_schema_tables():
         print(f"\n❌ Schema verification failed: {e}")
         return False
 
-def test_data_sources():
+def check_data_sources():
     """Verify initial data is populated."""
     print("\n" + "=" * 60)
     print("🔍 Checking Initial Data")
     print("=" * 60)
     
     try:
-        import psycopg2
-        
-        host = os.getenv("DB_HOST", "localhost")
-        port = os.getenv("DB_PORT", "5432")
-        database = os.getenv("DB_NAME", "sdn_database")
-        user = os.getenv("DB_USER", "sdn_user")
-        password = os.getenv("DB_PASSWORD", "sdn_password")
-        
-        conn = psycopg2.connect(
-            host=host,
-            port=port,
-            database=database,
-            user=user,
-            password=password
-        )
-        
-        cursor = conn.cursor()
-        
-        # Check data sources
-        cursor.execute("SELECT code, name, source_type FROM data_sources ORDER BY code;")
-        sources = cursor.fetchall()
+        # Data sources and active sanctions programs in one round trip
+        with _connection() as conn, conn.cursor() as cursor:
+            cursor.execute("""
+                SELECT 'source', code::text, name::text, source_type::text
+                FROM data_sources
+                UNION ALL
+                SELECT 'program', code::text, name::text, NULL
+                FROM sanctions_programs WHERE is_active = true
+                ORDER BY 1, 2;
+            """)
+            sources = []
+            programs = []
+            for kind, code, name, source_type in cursor.fetchall():
+                if kind == "source":
+                    sources.append((code, name, source_type))
+                else:
+                    programs.append((code, name))
         
         print(f"\n📊 Data Sources ({len(sources)} found):")
         for code, name, source_type in sources:
             print(f"  • {code}: {name} ({source_type})")
         
-        # Check sanctions programs
-        cursor.execute("SELECT code, name FROM sanctions_programs WHERE is_active = true ORDER BY code;")
-        programs = cursor.fetchall()
-        
         print(f"\n📊 Active Sanctions Programs ({len(programs)} found):")
         for code, name in programs:
             print(f"  • {code}: {name}")
         
-        cursor.close()
-        conn.close()
-        
         return len(sources) > 0 and len(programs) > 0
     except Exception as e:
         print(f"\n❌ Data check failed: {e}")
         return False
 
-def test_extensions():
+def check_extensions():
     """Verify required PostgreSQL extensions are installed."""
     print("\n" + "=" * 60)
     print("🔍 Checking PostgreSQL Extensions")
     print("=" * 60)
     
-    required_extensions = ['uuid-ossp', 'pg_trgm']
-    
     try:
-        import psycopg2
-        
-        host = os.getenv("DB_HOST", "localhost")
-        port = os.getenv("DB_PORT", "5432")
-        database = os.getenv("DB_NAME", "sdn_database")
-        user = os.getenv("DB_USER", "sdn_user")
-        password = os.getenv("DB_PASSWORD", "sdn_password")
-        
-        conn = psycopg2.connect(
-            host=host,
-            port=port,
-            database=database,
-            user=user,
-            password=password
-        )
-        
-        cursor = conn.cursor()
-        cursor.execute("SELECT extname FROM pg_extension;")
-        installed = [row[0] for row in cursor.fetchall()]
+        installed = _fetch_schema_snapshot()["ext"]
         
         print("\n📦 Extensions:")
         all_present = True
-        for ext in required_extensions:
+        for ext in _REQUIRED_EXTENSIONS:
             if ext in installed:
                 print(f"  ✅ {ext}")
             else:
                 print(f"  ❌ {ext} (MISSING)")
                 all_present = False
         
-        cursor.close()
-        conn.close()
-        
         return all_present
     except Exception as e:
         print(f"\n❌ Extension check failed: {e}")
@@ -311,12 +285,18 @@ def main():
     
     results = {}
     
-    # Run tests
-    results['basic'] = test_basic_connection()
-    results['sqlalchemy'] = test_sqlalchemy_connection()
-    results['schema'] = test_schema_tables()
-    results['data'] = test_data_sources()
-    results['extensions'] = test_extensions()
+    # Run tests; the rest only make sense once the server is reachable,
+    # otherwise each of them would wait out its own connection timeout
+    results['basic'] = check_basic_connection()
+    if results['basic']:
+        results['sqlalchemy'] = check_sqlalchemy_connection()
+        results['schema'] = check_schema_tables()
+        results['data'] = check_data_sources()
+        results['extensions'] = check_extensions()
+    else:
+        for test_name in ('sqlalchemy', 'schema', 'data', 'extensions'):
+            results[test_name] = None
+    _close_pool()
     
     # Summary
     print("\n" + "=" * 60)
@@ -325,7 +305,10 @@ def main():
     
     all_passed = True
     for test_name, passed in results.items():
-        status = "✅ PASSED" if passed else "❌ FAILED"
+        if passed is None:
+            status = "⏭️ SKIPPED"
+        else:
+            status = "✅ PASSED" if passed else "❌ FAILED"
         print(f"  {test_name}: {status}")
         if not passed:
             all_passed = False
@@ -334,9 +317,11 @@ def main():
         print("\n✅ All tests passed! Database is ready.")
         return 0
     else:
-        print("\n⚠️ Some tests failed. Check the output above.")
+        if results['basic']:
+            print("\n⚠️ Some tests failed. Check the output above.")
+        else:
+            print("\n⚠️ Could not connect to the database; remaining tests skipped.")
         return 1
 
 if __name__ == "__main__":
     sys.exit(main())
-    print("\n" + "=" * 60)
@@ -24,11 +24,13 @@ Performance Targets:
 import json
 import random
 import string
+import threading
 from typing import List
 
 # Locust imports - graceful handling if not installed
 try:
-    from locust import HttpUser, task, between, events, tag
+    from locust import task, between, events, tag
+    from locust.contrib.fasthttp import FastHttpUser
     from locust.runners import MasterRunner
 
     HAS_LOCUST = True
@@ -36,7 +38,7 @@ except ImportError:
     HAS_LOCUST = False
 
     # Create dummy classes for when locust isn't installed
-    class HttpUser:
+    class FastHttpUser:
         pass
 
     def task(weight=1):
@@ -87,6 +89,10 @@ SAMPLE_DOCUMENTS = [
 
 SAMPLE_COUNTRIES = ["US", "GB", "DE", "FR", "ES", "IT", "JP", "CN", "RU", "BR"]
 
+# Entity IDs fetched by the first user to warm up, shared by all users
+_ENTITY_ID_CACHE: List[str] = []
+_ENTITY_ID_LOCK = threading.Lock()
+
 
 def random_name() -> str:
     """Generate a random name for testing."""
@@ -95,10 +101,10 @@ def random_name() -> str:
         return random.choice(SAMPLE_NAMES)
     else:
         # 30% chance to generate random name
-        first = "".join(random.choices(string.ascii_uppercase, k=1)) + "".join(
+        first = random.choice(string.ascii_uppercase) + "".join(
             random.choices(string.ascii_lowercase, k=random.randint(3, 8))
         )
-        last = "".join(random.choices(string.ascii_uppercase, k=1)) + "".join(
+        last = random.choice(string.ascii_uppercase) + "".join(
             random.choices(string.ascii_lowercase, k=random.randint(4, 10))
         )
         return f"{first} {last}"
@@ -114,7 +120,7 @@ def random_document() -> str:
 
 if HAS_LOCUST:
 
-    class SDNCheckUser(HttpUser):
+    class SDNCheckUser(FastHttpUser):
         """
         Simulates a typical SDNCheck API user.
 
@@ -128,8 +134,9 @@ if HAS_LOCUST:
         # Wait 1-3 seconds between requests
         wait_time = between(1, 3)
 
-        # Track created entity IDs for subsequent requests
-        entity_ids: List[str] = []
+        # Fail requests that hang instead of stalling the user indefinitely
+        connection_timeout = 5.0
+        network_timeout = 10.0
 
         def on_start(self):
             """Called when a simulated user starts."""
@@ -137,18 +144,25 @@ if HAS_LOCUST:
             self._warm_up()
 
         def _warm_up(self):
-            """Fetch some entity IDs for testing."""
-            try:
-                response = self.client.get(
-                    "/api/entities", params={"limit": 10}, name="/api/entities (warmup)"
-                )
-                if response.status_code == 200:
-                    data = response.json()
-                    self.entity_ids = [
-                        e.get("id") for e in data.get("items", []) if e.get("id")
-                    ]
-            except Exception:
-                pass
+            """Fetch some entity IDs for testing, unless another user already has."""
+            if _ENTITY_ID_CACHE:
+                return
+            with _ENTITY_ID_LOCK:
+                if _ENTITY_ID_CACHE:
+                    return
+                try:
+                    response = self.client.get(
+                        "/api/entities",
+                        params={"limit": 10},
+                        name="/api/entities (warmup)",
+                    )
+                    if response.status_code == 200:
+                        data = response.json()
+                        _ENTITY_ID_CACHE.extend(
+                            e.get("id") for e in data.get("items", []) if e.get("id")
+                        )
+                except Exception:
+                    pass
 
         @task(6)
         @tag("search", "read")
@@ -238,11 +252,11 @@ if HAS_LOCUST:
 
             Tests direct entity lookup performance.
             """
-            if not self.entity_ids:
+            if not _ENTITY_ID_CACHE:
                 # Skip if we don't have any IDs
                 return
 
-            entity_id = random.choice(self.entity_ids)
+            entity_id = random.choice(_ENTITY_ID_CACHE)
 
             with self.client.get(
                 f"/api/entities/{entity_id}",
@@ -287,7 +301,7 @@ if HAS_LOCUST:
                 else:
                     response.failure(f"Status code: {response.status_code}")
 
-    class SDNCheckBulkUser(HttpUser):
+    class SDNCheckBulkUser(FastHttpUser):
         """
         Simulates bulk screening operations.
 
@@ -300,6 +314,10 @@ if HAS_LOCUST:
         # Lower weight - fewer bulk users
         weight = 1
 
+        # Bulk batches take longer to process than single screenings
+        connection_timeout = 5.0
+        network_timeout = 30.0
+
         @task
         @tag("bulk", "screening", "write")
         def bulk_screening(self):
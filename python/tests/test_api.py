@@ -5,17 +5,24 @@ Uses pytest, httpx.AsyncClient, and pytest-asyncio for async testing.
 Tests cover validation, success cases, bulk operations, health, and security.
 """
 
+import asyncio
 import pytest
+import pytest_asyncio
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 
 # Configure pytest-asyncio mode
 pytest_plugins = ["pytest_asyncio"]
 
+# Fixed screening timestamp for the mock results
+_FIXED_TS = "2024-01-01T00:00:00+00:00"
 
-# Mock screener for tests
-@pytest.fixture
+
+# Mock screener for tests. The result fixtures are session-scoped; the API
+# only reads them, so tests must not modify them either.
+@pytest.fixture(scope="session")
 def mock_match_result():
     """Create a mock match result."""
     return {
@@ -50,7 +57,7 @@ def mock_match_result():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_screening_result(mock_match_result):
     """Create a mock screening result."""
     return {
@@ -63,7 +70,7 @@ def mock_screening_result(mock_match_result):
             "nationality": None,
             "country": None,
         },
-        "screening_date": datetime.now(timezone.utc).isoformat(),
+        "screening_date": _FIXED_TS,
         "is_hit": True,
         "hit_count": 2,
         "matches": [mock_match_result, mock_match_result],
@@ -73,7 +80,7 @@ def mock_screening_result(mock_match_result):
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_no_hit_result():
     """Create a mock screening result with no matches."""
     return {
@@ -86,7 +93,7 @@ def mock_no_hit_result():
             "nationality": None,
             "country": None,
         },
-        "screening_date": datetime.now(timezone.utc).isoformat(),
+        "screening_date": _FIXED_TS,
         "is_hit": False,
         "hit_count": 0,
         "matches": [],
@@ -99,20 +106,16 @@ def mock_no_hit_result():
 @pytest.fixture
 def mock_screener(mock_screening_result, mock_no_hit_result):
     """Create a mock screener instance."""
-    screener = MagicMock()
-    screener.entities = [{"id": "1"}, {"id": "2"}, {"id": "3"}]  # 3 mock entities
 
     def mock_screen(name, **kwargs):
         if "safe" in name.lower():
             return mock_no_hit_result
         return mock_screening_result
 
-    screener.screen_individual = mock_screen
-
     def mock_bulk_screen(csv_file, **kwargs):
         return {
             "screening_info": {
-                "date": datetime.now(timezone.utc).isoformat(),
+                "date": _FIXED_TS,
                 "analyst": None,
                 "total_screened": 2,
                 "total_hits": 1,
@@ -123,24 +126,27 @@ def mock_screener(mock_screening_result, mock_no_hit_result):
             "hits_only": [mock_screening_result],
         }
 
-    screener.bulk_screen = mock_bulk_screen
-    screener.load_ofac = MagicMock(return_value=100)
-    screener.load_un = MagicMock(return_value=50)
-
-    return screener
+    return SimpleNamespace(
+        entities=[{"id": "1"}, {"id": "2"}, {"id": "3"}],  # 3 mock entities
+        screen_individual=mock_screen,
+        bulk_screen=mock_bulk_screen,
+        load_ofac=lambda: 100,
+        load_un=lambda: 50,
+    )
 
 
 @pytest.fixture
 def mock_config():
     """Create a mock config instance."""
-    config = MagicMock()
-    config.algorithm.version = "2.0.0"
-    config.matching.name_threshold = 75
-    config.matching.short_name_threshold = 75
-    config.input_validation.name_min_length = 2
-    config.input_validation.name_max_length = 200
-    config.input_validation.blocked_characters = "<>{}[]|\\;`$"
-    return config
+    return SimpleNamespace(
+        algorithm=SimpleNamespace(version="2.0.0"),
+        matching=SimpleNamespace(name_threshold=75, short_name_threshold=75),
+        input_validation=SimpleNamespace(
+            name_min_length=2,
+            name_max_length=200,
+            blocked_characters="<>{}[]|\\;`$",
+        ),
+    )
 
 
 @pytest.fixture
@@ -157,6 +163,19 @@ def client(mock_screener, mock_config):
                 yield TestClient(server.app)
 
 
+@pytest_asyncio.fixture
+async def aclient(client):
+    """Create an async client on the same patched app."""
+    import httpx
+    from api import server
+
+    transport = httpx.ASGITransport(app=server.app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://testserver"
+    ) as async_client:
+        yield async_client
+
+
 # ============================================
 # VALIDATION TESTS
 # ============================================
@@ -499,15 +518,21 @@ class TestPerformance:
         # With mocked screener, should be very fast
         assert elapsed_ms < 100
 
-    # Sync test
+    # Async test
     @pytest.mark.slow
-    def test_concurrent_requests(self, client):
-        """10 sequential requests should all succeed (sync version)."""
-        # Run 10 requests sequentially (sync TestClient)
-        responses = []
-        for i in range(10):
-            response = client.post("/api/v1/screen", json={"name": f"Test Name {i}"})
-            responses.append(response)
+    @pytest.mark.asyncio
+    async def test_batch_of_requests(self, aclient):
+        """A batch of 10 requests gathered on one client should all succeed.
+
+        The screen endpoint calls the screener synchronously, so the event
+        loop still handles these requests one at a time.
+        """
+        responses = await asyncio.gather(
+            *(
+                aclient.post("/api/v1/screen", json={"name": f"Test Name {i}"})
+                for i in range(10)
+            )
+        )
 
         # All should succeed
         for response in responses:
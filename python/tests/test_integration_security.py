@@ -7,6 +7,7 @@ End-to-end tests that verify security across the entire system:
 - Cross-component security
 """
 
+import logging
 import pytest
 from pathlib import Path
 
@@ -20,7 +21,9 @@ from xml_utils import sanitize_for_logging, secure_parse
 from security_logger import (
     SecurityLogger,
     SecurityEvent,
+    get_security_logger,
     reset_security_logger,
+    _REQUEST_CONTEXT,
 )
 
 
@@ -36,8 +39,11 @@ class TestSecurityLoggerIntegration:
 
     @pytest.fixture(autouse=True)
     def reset_logger(self):
-        """Reset logger before each test"""
+        """Reset logger and request context around each test"""
         reset_security_logger()
+        token = _REQUEST_CONTEXT.set(("", "", ""))
+        yield
+        _REQUEST_CONTEXT.reset(token)
 
     def test_security_logger_creates_log_file(self, temp_log_dir):
         """Test that security logger creates security.log file"""
@@ -87,6 +93,108 @@ class TestSecurityLoggerIntegration:
 
         assert "REQ-12345" in log_content
 
+    def test_security_logger_attaches_event_to_record(self, temp_log_dir):
+        """Handlers can read the SecurityEvent without parsing the message"""
+        logger = SecurityLogger(log_dir=str(temp_log_dir))
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        logger.logger.addHandler(handler)
+
+        logger.log_validation_failure(
+            field="name", error_code="E1", input_value="x", source="test"
+        )
+
+        assert len(records) == 1
+        event = records[0].security_event
+        assert isinstance(event, SecurityEvent)
+        assert event.error_code == "E1"
+        assert records[0].getMessage() == event.to_json()
+
+    def test_security_logger_request_context_per_thread(self, temp_log_dir):
+        """Request context set in one thread is not seen by another"""
+        import threading
+
+        logger = SecurityLogger(log_dir=str(temp_log_dir))
+        logger.set_request_context(request_id="REQ-MAIN")
+
+        def worker():
+            logger.log_validation_failure(
+                field="name", error_code="WORKER", input_value="x", source="test"
+            )
+            logger.set_request_context(request_id="REQ-WORKER")
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        logger.log_validation_failure(
+            field="name", error_code="MAIN", input_value="x", source="test"
+        )
+
+        worker_line, main_line = (
+            (temp_log_dir / "security.log").read_text().strip().split("\n")
+        )
+        assert '"error_code":"WORKER"' in worker_line
+        assert '"request_id":""' in worker_line
+        assert '"error_code":"MAIN"' in main_line
+        assert '"request_id":"REQ-MAIN"' in main_line
+
+    def test_security_logger_queue_flushes_on_close(self, temp_log_dir):
+        """Queued events are all written once the logger is closed"""
+        logger = SecurityLogger(log_dir=str(temp_log_dir), use_queue=True)
+        for i in range(20):
+            logger.log_validation_failure(
+                field="name", error_code=f"E{i}", input_value="x", source="test"
+            )
+        logger.close()
+
+        lines = (temp_log_dir / "security.log").read_text().strip().split("\n")
+        assert len(lines) == 20
+        assert '"error_code":"E19"' in lines[-1]
+
+    def test_security_logger_skips_disabled_levels(self, temp_log_dir, monkeypatch):
+        """Events below the logger level are not sanitized or written"""
+        logger = SecurityLogger(log_dir=str(temp_log_dir), log_level=logging.ERROR)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("event should not be built")
+
+        monkeypatch.setattr(logger, "_sanitize_input", fail)
+        monkeypatch.setattr(logger, "_sanitize_context", fail)
+        logger.log_validation_failure(
+            field="name", error_code="E1", input_value="x", source="test"
+        )
+        logger.log_security_event(
+            event_type="XXE_ATTEMPT",
+            severity="WARNING",
+            field="xml",
+            error_code="XXE",
+            input_value="x",
+            source="test",
+        )
+
+        assert (temp_log_dir / "security.log").read_text() == ""
+
+    def test_global_queued_logger_flushed_on_reset(self, temp_log_dir, monkeypatch):
+        """reset_security_logger closes the global logger, writing queued events"""
+        import atexit
+
+        exit_hooks = []
+        monkeypatch.setattr(atexit, "register", exit_hooks.append)
+        monkeypatch.setattr(atexit, "unregister", exit_hooks.remove)
+
+        reset_security_logger()
+        logger = get_security_logger(log_dir=str(temp_log_dir), use_queue=True)
+        assert exit_hooks == [logger.close]
+        logger.log_validation_failure(
+            field="name", error_code="QUEUED", input_value="x", source="test"
+        )
+        reset_security_logger()
+
+        assert exit_hooks == []
+        assert logger._listener is None
+        assert '"error_code":"QUEUED"' in (temp_log_dir / "security.log").read_text()
+
     def test_security_event_to_json(self):
         """Test SecurityEvent JSON serialization"""
         event = SecurityEvent(
@@ -102,6 +210,22 @@ class TestSecurityLoggerIntegration:
         assert "XXE_ATTEMPT" in json_str
         assert "ERROR" in json_str
 
+    def test_security_event_to_json_without_orjson(self, monkeypatch):
+        """The stdlib fallback writes the same JSON text as orjson"""
+        import security_logger
+
+        event = SecurityEvent(
+            event_type="VALIDATION_FAILED",
+            severity="WARNING",
+            sanitized_input="José",
+            additional_context={"count": 2, "items": ["a", None], "ok": True},
+        )
+        json_str = event.to_json()
+
+        monkeypatch.setattr(security_logger, "HAS_ORJSON", False)
+        assert event.to_json() == json_str
+        assert '"sanitized_input":"José"' in json_str
+
     def test_log_xxe_attempt(self, temp_log_dir):
         """Test XXE attempt logging"""
         logger = SecurityLogger(log_dir=str(temp_log_dir))
@@ -129,6 +253,11 @@ class TestSecurityLoggerIntegration:
 
         assert "SQL_INJECTION_ATTEMPT" in log_content
 
+        logger.log_injection_attempt(
+            injection_type="xpath", field="name", input_value="' or '1'='1"
+        )
+        assert "XPATH_INJECTION_ATTEMPT" in log_file.read_text()
+
 
 class TestEndToEndSecurityFlow:
     """End-to-end security tests"""
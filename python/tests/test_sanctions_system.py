@@ -82,6 +82,24 @@ matching:
         with pytest.raises(ConfigurationError):
             ConfigManager(str(config_file))
 
+    def test_negative_weights_validation(self, tmp_path):
+        """Test that a negative weight raises error even if the sum is 1.0"""
+        config_content = """
+matching:
+  weights:
+    name: 1.10
+    document: 0.0
+    dob: -0.10
+    nationality: 0.0
+    address: 0.0
+"""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(config_content)
+
+        ConfigManager.reset_instance()
+        with pytest.raises(ConfigurationError):
+            ConfigManager(str(config_file))
+
     def test_invalid_thresholds_order(self, tmp_path):
         """Test that invalid threshold order raises error"""
         config_content = """
@@ -171,6 +189,27 @@ class TestNameNormalization:
         assert screener._normalize_name("") == ""
         assert screener._normalize_name(None) == ""
 
+    def test_normalize_ascii_matches_unicode_path(self):
+        """ASCII fast path treats punctuation like the accented path"""
+        from screener import EnhancedSanctionsScreener
+
+        screener = EnhancedSanctionsScreener.__new__(EnhancedSanctionsScreener)
+
+        assert screener._normalize_name(" O'Brien_Smith,\tJ. ") == "O BRIEN_SMITH J"
+        assert screener._normalize_name(" O'Bríen_Smith,\tJ. ") == "O BRIEN_SMITH J"
+
+    def test_ofac_feature_field(self):
+        """OFAC feature types map to the entity fields they fill"""
+        from screener import _ofac_feature_field
+
+        assert _ofac_feature_field("Birthdate") == "dateOfBirth"
+        assert _ofac_feature_field("Date of Birth") == "dateOfBirth"
+        assert _ofac_feature_field("Place of Birth") == "placeOfBirth"
+        assert _ofac_feature_field("Nationality Country") == "nationality"
+        assert _ofac_feature_field("Citizenship Country") == "citizenship"
+        assert _ofac_feature_field("Vessel Flag") == "vesselIMO"
+        assert _ofac_feature_field("Website") is None
+
 
 class TestDocumentNormalization:
     """Tests for document number normalization"""
@@ -255,6 +294,15 @@ class TestConfidenceScoring:
         score = screener._calculate_dob_score("1985", "1990")
         assert score == 0.0  # 100 - (5 * 20) = 0
 
+    def test_dob_score_from_years(self):
+        """Year-based DOB score is symmetric and capped at 0"""
+        from screener import _dob_score_from_years
+
+        assert _dob_score_from_years(1985, 1985) == 100
+        assert _dob_score_from_years(1985, 1987) == 60
+        assert _dob_score_from_years(1987, 1985) == 60
+        assert _dob_score_from_years(1985, 2000) == 0
+
 
 class TestReportValidation:
     """Tests for report validation"""
@@ -405,6 +453,21 @@ class TestMatchResult:
         assert "COMMON_NAME" in result_dict["flags"]
         assert result_dict["recommendation"] == "MANUAL_REVIEW"
 
+    def test_match_result_to_dict_omits_cached_fields(self):
+        """Load-time caches (underscore keys) are not serialized"""
+        from screener import MatchResult, ConfidenceBreakdown
+
+        result = MatchResult(
+            entity={
+                "id": "123",
+                "name": "Test Entity",
+                "_norm_all_names": ("TEST ENTITY",),
+            },
+            confidence=ConfidenceBreakdown(overall=90.0),
+        )
+
+        assert result.to_dict()["entity"] == {"id": "123", "name": "Test Entity"}
+
 
 class TestOFACXMLParsing:
     """Tests for OFAC XML parsing with mock data"""
@@ -667,6 +730,18 @@ class TestSecurityValidation:
         with pytest.raises(InputValidationError):
             validate_screening_input(input_data)
 
+    def test_input_validation_dob_trailing_newline(self):
+        """Test that DOB with trailing newline is rejected (full match)"""
+        from screener import (
+            ScreeningInput,
+            validate_screening_input,
+            InputValidationError,
+        )
+
+        input_data = ScreeningInput(name="John Doe", date_of_birth="1985\n")
+        with pytest.raises(InputValidationError):
+            validate_screening_input(input_data)
+
     def test_input_validation_valid_dob(self):
         """Test that valid DOB formats pass"""
         from screener import ScreeningInput, validate_screening_input
@@ -692,6 +767,15 @@ class TestSecurityValidation:
         assert "\n" not in result
         assert "[ERROR]" in result  # Text kept, but on same line
 
+    def test_sanitize_for_logging_ascii_and_unicode(self):
+        """ASCII and non-ASCII input get the same control/space handling"""
+        from xml_utils import sanitize_for_logging
+
+        assert sanitize_for_logging(" John\x00\tDoe\r\n\x7fX ") == "John Doe X"
+        assert sanitize_for_logging(" José\x00\tDoe\r\n\x85X ") == "José Doe X"
+        # Formatting characters are removed, not turned into spaces
+        assert sanitize_for_logging("Jo\u200bsé\u2028 Doe\ufeff") == "José Doe"
+
     def test_sanitize_for_logging_empty(self):
         """Test sanitization of empty input"""
         from xml_utils import sanitize_for_logging
@@ -724,6 +808,73 @@ class TestSecurityValidation:
             # Parser rejected the malicious content - also acceptable
             pass
 
+    def test_xxe_prevention_iterparse(self, tmp_path):
+        """Test that streaming parses do not expand external entities"""
+        import xml_utils
+
+        if not xml_utils.HAS_LXML:
+            pytest.skip("lxml not installed")
+
+        xxe_content = """<?xml version="1.0"?>
+<!DOCTYPE foo [
+  <!ENTITY xxe SYSTEM "file:///etc/passwd">
+]>
+<root>&xxe;</root>"""
+
+        xml_file = tmp_path / "xxe_test.xml"
+        xml_file.write_text(xxe_content)
+
+        parsed = [
+            (elem.tag, elem.text) for _, elem in xml_utils.secure_iterparse(xml_file)
+        ]
+
+        # The entity is left unresolved, so the file is never read
+        assert parsed == [("root", None)]
+
+    def test_iterparse_keeps_internal_entities_unresolved(self, tmp_path):
+        """lxml streaming parses run with resolve_entities=False"""
+        import xml_utils
+
+        if not xml_utils.HAS_LXML:
+            pytest.skip("lxml not installed")
+
+        xml_file = tmp_path / "entity_test.xml"
+        xml_file.write_text(
+            """<?xml version="1.0"?>
+<!DOCTYPE foo [
+  <!ENTITY e "expanded">
+]>
+<root>a&e;b</root>"""
+        )
+
+        elements = [elem for _, elem in xml_utils.secure_iterparse(xml_file)]
+
+        assert len(elements) == 1
+        assert elements[0].text == "a"
+        assert "expanded" not in xml_utils.lxml_etree.tostring(elements[0]).decode()
+
+    def test_xxe_prevention_iterparse_defusedxml(self, tmp_path, monkeypatch):
+        """Without lxml, streaming parses go through defusedxml"""
+        defused_et = pytest.importorskip("defusedxml.ElementTree")
+        import defusedxml
+        import xml_utils
+
+        monkeypatch.setattr(xml_utils, "HAS_LXML", False)
+        monkeypatch.setattr(xml_utils, "HAS_DEFUSEDXML", True)
+        monkeypatch.setattr(xml_utils, "defused_ET", defused_et, raising=False)
+
+        xml_file = tmp_path / "xxe_test.xml"
+        xml_file.write_text(
+            """<?xml version="1.0"?>
+<!DOCTYPE foo [
+  <!ENTITY xxe SYSTEM "file:///etc/passwd">
+]>
+<root>&xxe;</root>"""
+        )
+
+        with pytest.raises(defusedxml.DefusedXmlException):
+            list(xml_utils.secure_iterparse(xml_file))
+
 
 class TestUnicodeNameSupport:
     """Tests for international name support"""
@@ -1412,5 +1563,340 @@ class TestXSDSeverityClassification:
         assert result.severity == "INFO"
 
 
+class TestScreenerSearch:
+    """Tests for name search over entities loaded from OFAC XML"""
+
+    OFAC_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<sanctions xmlns="https://sanctionslistservice.ofac.treas.gov/api/PublicationPreview/exports/ENHANCED_XML">
+    <entity id="1">
+        <entityType>Individual</entityType>
+        <names>
+            <name><translations><translation>
+                <formattedFullName>DOE, John</formattedFullName>
+            </translation></translations></name>
+            <name><translations><translation>
+                <formattedFullName>Johnny Doe</formattedFullName>
+            </translation></translations></name>
+        </names>
+        <identityDocuments>
+            <identityDocument>
+                <type>Passport</type>
+                <documentNumber>X-123 456</documentNumber>
+            </identityDocument>
+        </identityDocuments>
+    </entity>
+    <entity id="2">
+        <entityType>Individual</entityType>
+        <names>
+            <name><translations><translation>
+                <formattedFullName>Maria Gonzalez</formattedFullName>
+            </translation></translations></name>
+        </names>
+    </entity>
+    <entity id="3">
+        <entityType>Individual</entityType>
+        <names>
+            <name><translations><translation>
+                <formattedFullName>John Doe</formattedFullName>
+            </translation></translations></name>
+        </names>
+        <features>
+            <feature>
+                <type>Birthdate</type>
+                <value>1970-05-01</value>
+            </feature>
+        </features>
+    </entity>
+</sanctions>"""
+
+    @pytest.fixture
+    def screener(self, tmp_path, monkeypatch):
+        """Screener loaded with a small OFAC file"""
+        from screener import EnhancedSanctionsScreener
+
+        monkeypatch.chdir(tmp_path)
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        (data_dir / "SDN_ENHANCED.XML").write_text(self.OFAC_XML)
+
+        screener = EnhancedSanctionsScreener(data_dir=str(data_dir))
+        assert screener.load_ofac() == 3
+        return screener
+
+    def test_search_returns_best_alias_per_entity(self, screener):
+        """Each entity is reported once, with its best-scoring name"""
+        from screener import ScreeningInput
+
+        results = screener.search(ScreeningInput(name="John Doe"))
+
+        assert [r.entity["id"] for r in results] == ["1", "3"]
+        assert results[0].matched_name == "DOE, John"
+        assert results[0].confidence.name_score == 100.0
+
+    def test_search_dob_score_matches_calculate_dob_score(self, screener):
+        """search() scores DOB with the same formula as _calculate_dob_score"""
+        from screener import ScreeningInput
+
+        results = screener.search(
+            ScreeningInput(name="John Doe", date_of_birth="1971-02-03")
+        )
+        by_id = {r.entity["id"]: r for r in results}
+
+        assert by_id["3"].confidence.dob_score == 80.0
+        assert by_id["3"].confidence.dob_score == screener._calculate_dob_score(
+            "1971-02-03", "1970-05-01"
+        )
+        assert by_id["1"].confidence.dob_score == 0.0
+
+    def test_search_limit_keeps_top_ranked(self, screener):
+        """limit truncates the ranked list; ties keep entity order"""
+        from screener import ScreeningInput
+
+        results = screener.search(ScreeningInput(name="John Doe"), limit=1)
+
+        assert [r.entity["id"] for r in results] == ["1"]
+
+    def test_search_skips_scoring_when_threshold_unreachable(
+        self, screener, monkeypatch
+    ):
+        """Names are not scored when even a perfect name cannot pass"""
+        import screener as screener_module
+        from screener import ScreeningInput
+
+        weights = screener.config.matching.weights
+        monkeypatch.setitem(weights, "name", 0.5)
+        monkeypatch.setitem(weights, "document", 0.3)
+        monkeypatch.setitem(weights, "dob", 0.2)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("names should not be scored")
+
+        monkeypatch.setattr(screener_module.process, "extract", fail)
+
+        assert screener.search(ScreeningInput(name="John Doe")) == []
+
+    def test_search_skips_entities_below_low_match(self, screener):
+        """Entities with no name near the query are not returned"""
+        from screener import ScreeningInput
+
+        results = screener.search(ScreeningInput(name="Maria Gonzales"))
+
+        assert [r.entity["id"] for r in results] == ["2"]
+
+    def test_bulk_screen_parallel_matches_sequential(self, screener, tmp_path):
+        """Worker processes return the same rows, in CSV order"""
+        csv_file = tmp_path / "input.csv"
+        csv_file.write_text(
+            "nombre,cedula,pais\n"
+            "John Doe,,\n"
+            ",,\n"
+            "Maria Gonzales,,\n"
+            "Nobody Here,X123456,\n"
+        )
+
+        def strip(summary):
+            return [
+                (r["input"]["name"], r["hit_count"], r["matches"])
+                for r in summary["results"]
+            ]
+
+        sequential = screener.bulk_screen(str(csv_file))
+        parallel = screener.bulk_screen(str(csv_file), max_workers=2)
+
+        assert strip(parallel) == strip(sequential)
+        assert [r["input"]["name"] for r in parallel["results"]] == [
+            "John Doe",
+            "Maria Gonzales",
+            "Nobody Here",
+        ]
+        assert len(screener.screening_history) == 0
+
+    def test_bulk_screen_parallel_reports_in_parent(
+        self, screener, tmp_path, monkeypatch
+    ):
+        """Workers only screen; reports are written by the calling process"""
+        import os
+        from screener import EnhancedSanctionsScreener
+
+        monkeypatch.setattr(
+            EnhancedSanctionsScreener,
+            "_generate_reports",
+            lambda self, result, matches: {"pid": os.getpid(), "hits": len(matches)},
+        )
+        csv_file = tmp_path / "input.csv"
+        csv_file.write_text("nombre,cedula,pais\nJohn Doe,,\nNobody Here,,\n")
+
+        summary = screener.bulk_screen(
+            str(csv_file), generate_individual_reports=True, max_workers=2
+        )
+
+        assert [r["report_files"] for r in summary["results"]] == [
+            {"pid": os.getpid(), "hits": 2},
+            {"pid": os.getpid(), "hits": 0},
+        ]
+
+    def test_bulk_worker_returns_matches_only_for_reports(self, screener, monkeypatch):
+        """Workers send matches back only when reports need them"""
+        import screener as screener_module
+
+        monkeypatch.setattr(screener_module, "_bulk_worker_screener", screener)
+        kwargs = {"name": "John Doe"}
+
+        result, matches = screener_module._screen_bulk_row(kwargs, keep_matches=False)
+        assert result["hit_count"] == 2
+        assert matches == []
+
+        result, matches = screener_module._screen_bulk_row(kwargs, keep_matches=True)
+        assert [m.entity["id"] for m in matches] == ["1", "3"]
+        assert not any(k.startswith("_") for m in matches for k in m.entity)
+        # The loaded entities keep their match caches
+        assert "_norm_all_names" in screener.entities[0]
+
+    def test_report_metadata_collected_once(self, screener, monkeypatch):
+        """List metadata is reused across reports until a list is reloaded"""
+        import report_generator
+
+        calls = []
+        monkeypatch.setattr(
+            report_generator.ReportMetadataCollector,
+            "collect_all_metadata",
+            lambda self: calls.append(1) or [],
+        )
+
+        screener.screen_individual("John Doe")
+        screener.screen_individual("Maria Gonzales")
+        assert len(calls) == 1
+
+        screener.load_ofac()
+        screener.screen_individual("John Doe")
+        assert len(calls) == 2
+
+    def test_screening_history_evicts_oldest(self, screener):
+        """History keeps only the most recent screenings"""
+        history = screener.screening_history
+        assert history.maxlen == screener._max_history_size
+
+        # Fill the history to one short of the limit, then screen twice
+        history.extend(
+            {"input": {"name": f"old-{i}"}} for i in range(history.maxlen - 1)
+        )
+        for name in ("John Doe", "Maria Gonzales"):
+            screener.screen_individual(name, generate_report=False)
+
+        assert len(history) == screener._max_history_size
+        assert history[0]["input"]["name"] == "old-1"
+        assert [r["input"]["name"] for r in list(history)[-2:]] == [
+            "John Doe",
+            "Maria Gonzales",
+        ]
+
+    def test_load_ofac_addresses(self, screener):
+        """Address fields take the first element's text; blanks are dropped"""
+        (screener.data_dir / "SDN_ENHANCED.XML").write_text(
+            """<?xml version="1.0" encoding="UTF-8"?>
+<sanctions>
+    <entity id="7">
+        <names>
+            <name><translations><translation>
+                <formattedFullName>Acme Trading</formattedFullName>
+            </translation></translations></name>
+        </names>
+        <addresses>
+            <address>
+                <city> Havana </city>
+                <country>Cuba</country>
+                <country>Spain</country>
+                <postalCode>  </postalCode>
+            </address>
+            <address><translations /></address>
+        </addresses>
+    </entity>
+</sanctions>"""
+        )
+
+        assert screener.load_ofac() == 1
+        entity = screener.entities[-1]
+        assert entity["addresses"] == [{"city": "Havana", "country": "Cuba"}]
+        assert entity["countries"] == ["Cuba"]
+
+    def test_load_ofac_does_not_expand_external_entities(self, screener, tmp_path):
+        """XXE payloads in the OFAC file are not resolved; other entities load"""
+        secret = tmp_path / "secret.txt"
+        secret.write_text("TOPSECRET")
+        (screener.data_dir / "SDN_ENHANCED.XML").write_text(
+            f"""<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE sanctions [
+  <!ENTITY xxe SYSTEM "{secret.as_uri()}">
+]>
+<sanctions xmlns="https://sanctionslistservice.ofac.treas.gov/api/PublicationPreview/exports/ENHANCED_XML">
+    <entity id="8">
+        <names>
+            <name><translations><translation>
+                <formattedFullName>&xxe;</formattedFullName>
+            </translation></translations></name>
+        </names>
+    </entity>
+    <entity id="9">
+        <names>
+            <name><translations><translation>
+                <formattedFullName>Acme Trading</formattedFullName>
+            </translation></translations></name>
+        </names>
+    </entity>
+</sanctions>"""
+        )
+
+        screener.load_ofac()
+
+        assert "9" in [e["id"] for e in screener.entities]
+        assert "TOPSECRET" not in repr(screener.entities)
+
+    def test_load_un_adds_individuals_before_entities(self, screener):
+        """Streamed UN records keep the individuals-then-entities order"""
+        (screener.data_dir / "un_consolidated.xml").write_text(
+            """<?xml version="1.0" encoding="UTF-8"?>
+<CONSOLIDATED_LIST>
+    <ENTITIES>
+        <ENTITY><DATAID>900</DATAID><FIRST_NAME>Acme Trading</FIRST_NAME></ENTITY>
+    </ENTITIES>
+    <INDIVIDUALS>
+        <INDIVIDUAL>
+            <DATAID>800</DATAID>
+            <FIRST_NAME>Ivan</FIRST_NAME>
+            <SECOND_NAME>Petrov</SECOND_NAME>
+            <INDIVIDUAL_ALIAS><ALIAS_NAME>Ivan P.</ALIAS_NAME></INDIVIDUAL_ALIAS>
+        </INDIVIDUAL>
+    </INDIVIDUALS>
+</CONSOLIDATED_LIST>"""
+        )
+
+        assert screener.load_un() == 2
+        assert [e["id"] for e in screener.entities[3:]] == ["800", "900"]
+        assert screener.entities[3]["all_names"] == ["Ivan Petrov", "Ivan P."]
+
+    def test_length_window_bounds(self):
+        """Only candidate lengths that can reach the cutoff are kept"""
+        from screener import EnhancedSanctionsScreener
+
+        screener = EnhancedSanctionsScreener.__new__(EnhancedSanctionsScreener)
+        screener._candidate_lengths = [3, 4, 5, 10, 23, 24]
+
+        # cutoff 60, query length 10: lengths 5..23 can still score >= 60
+        assert screener._length_window(10, 60) == (2, 5)
+        assert screener._length_window(10, 0) == (0, 6)
+
+    def test_search_document_match_not_duplicated(self, screener):
+        """A document hit is returned once, ahead of name matches"""
+        from screener import ScreeningInput
+
+        results = screener.search(
+            ScreeningInput(name="John Doe", document_number="x123456")
+        )
+
+        assert [r.entity["id"] for r in results] == ["1", "3"]
+        assert results[0].match_layer == 1
+        assert results[0].matched_document == "X-123 456"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -31,6 +31,13 @@ import xml.etree.ElementTree as ET
 
 logger = logging.getLogger(__name__)
 
+# Patterns used by sanitize_for_logging, compiled once at import. ASCII
+# input can only contain the C0 controls and DEL, which a translate table
+# replaces in one C pass; the regexes handle everything else.
+_LOG_CONTROL_RE = re.compile(r"[\r\n\x00-\x1f\x7f-\x9f]")
+_LOG_FORMAT_CHARS_RE = re.compile(r"[\u200B-\u200F\u2028\u2029\uFEFF]")
+_ASCII_CONTROL_TABLE = str.maketrans({c: " " for c in (*range(0x20), 0x7F)})
+
 
 def get_secure_parser():
     """Get a secure XML parser that prevents XXE attacks
@@ -93,9 +100,19 @@ def secure_iterparse(
         Iterator over (event, element) tuples
     """
     if HAS_LXML:
+        # Same protections as get_secure_parser()
+        options = dict(
+            events=events,
+            resolve_entities=False,
+            no_network=True,
+            load_dtd=False,
+            huge_tree=False,
+        )
         if tag:
-            return lxml_etree.iterparse(str(xml_path), events=events, tag=tag)
-        return lxml_etree.iterparse(str(xml_path), events=events)
+            return lxml_etree.iterparse(str(xml_path), tag=tag, **options)
+        return lxml_etree.iterparse(str(xml_path), **options)
+    elif HAS_DEFUSEDXML:
+        return defused_ET.iterparse(str(xml_path), events=events)
     else:
         # stdlib doesn't support tag filter
         return ET.iterparse(xml_path, events=events)
@@ -116,14 +133,23 @@ def sanitize_for_logging(text: str) -> str:
     """
     if not text:
         return ""
-    # Remove newlines, carriage returns, and other control characters (C0, C1)
-    sanitized = re.sub(r"[\r\n\x00-\x1f\x7f-\x9f]", " ", str(text))
-    # Remove Unicode formatting characters (zero-width, BOM, line/paragraph separators)
-    # \u200B = zero-width space, \uFEFF = BOM, \u2028 = line separator, \u2029 = paragraph separator
-    # \u200C-\u200F = various zero-width and direction markers
-    sanitized = re.sub(r"[\u200B-\u200F\u2028\u2029\uFEFF]", "", sanitized)
-    # Collapse multiple spaces
-    sanitized = re.sub(r"\s+", " ", sanitized).strip()
+    text = str(text)
+    if text.isprintable():
+        # No control, formatting or separator characters: only the spaces
+        # need collapsing (the common case for names and field values)
+        sanitized = text
+    elif text.isascii():
+        # Remove newlines, carriage returns, and other control characters
+        sanitized = text.translate(_ASCII_CONTROL_TABLE)
+    else:
+        # Remove newlines, carriage returns, and other control characters (C0, C1)
+        sanitized = _LOG_CONTROL_RE.sub(" ", text)
+        # Remove Unicode formatting characters (zero-width, BOM, line/paragraph separators)
+        # \u200B = zero-width space, \uFEFF = BOM, \u2028 = line separator, \u2029 = paragraph separator
+        # \u200C-\u200F = various zero-width and direction markers
+        sanitized = _LOG_FORMAT_CHARS_RE.sub("", sanitized)
+    # Collapse whitespace runs and trim the ends
+    sanitized = " ".join(sanitized.split())
     # Truncate to reasonable length
     return sanitized[:500] if len(sanitized) > 500 else sanitized
 